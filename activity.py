@@ -0,0 +1,128 @@
+"""
+ActivityWatcher class
+"""
+import threading
+
+
+# Events emitted by ActivityWatcher
+EVENTS = ('started', 'paused', 'resumed', 'stopped', 'transcode_changed',
+          'error')
+# Session fields compared to detect a transcode change
+TRANSCODE_KEYS = ('transcode_decision', 'video_decision', 'audio_decision',
+                  'subtitle_decision', 'stream_video_resolution',
+                  'stream_bitrate', 'transcode_hw_encoding')
+
+
+class ActivityWatcher:
+    """get_activity poller emitting per-session change events"""
+
+    def __init__(self, tautulli, active_interval=2, idle_interval=30):
+        """ActivityWatcher constructor"""
+        self.tautulli = tautulli
+        # Poll interval while streams are active
+        self.active_interval = active_interval
+        # Upper bound of the interval while idle, reached by doubling
+        self.idle_interval = idle_interval
+        self.interval = active_interval
+        self._callbacks = {event: [] for event in EVENTS}
+        self._queues = []
+        # session_key -> (state, transcode fingerprint, session)
+        self._sessions = {}
+        self._stop = threading.Event()
+        self._thread = None
+
+    def on(self, event, callback):
+        """
+        Register `callback(event, session)` for an event.
+
+        "error" callbacks receive the exception as `session`: a failed
+        get_activity poll, or an exception raised by another callback.
+        A failing callback does not stop the others or later events.
+        """
+        self._callbacks[event].append(callback)
+        return callback
+
+    def attach_queue(self, queue, loop):
+        """Also put (event, session) tuples on an asyncio queue"""
+        self._queues.append((queue, loop))
+
+    def poll(self):
+        """
+        Poll get_activity once and emit events for changed sessions.
+
+        Returns:
+            list of (event, session) tuples
+        """
+        data = self.tautulli.get_activity()['response']['data']
+        sessions = data.get('sessions') or []
+        events = self._diff(sessions)
+        for event, session in events:
+            self._emit(event, session)
+        if sessions:
+            self.interval = self.active_interval
+        else:
+            self.interval = min(self.idle_interval, self.interval * 2)
+        return events
+
+    def _diff(self, sessions):
+        """Compare sessions with the previous poll by session_key"""
+        events = []
+        previous = self._sessions
+        current = {}
+        for session in sessions:
+            key = session.get('session_key')
+            state = session.get('state')
+            transcode = tuple(session.get(k) for k in TRANSCODE_KEYS)
+            current[key] = (state, transcode, session)
+            old = previous.get(key)
+            if old is None:
+                events.append(('started', session))
+                continue
+            if old[0] != state:
+                if state == 'paused':
+                    events.append(('paused', session))
+                elif old[0] == 'paused':
+                    events.append(('resumed', session))
+            if old[1] != transcode:
+                events.append(('transcode_changed', session))
+        for key, old in previous.items():
+            if key not in current:
+                events.append(('stopped', old[2]))
+        self._sessions = current
+        return events
+
+    def _emit(self, event, session):
+        for callback in self._callbacks[event]:
+            try:
+                callback(event, session)
+            except Exception as e:
+                # The poll already moved on, report instead of losing events
+                if event != 'error':
+                    self._emit('error', e)
+        for queue, loop in self._queues:
+            loop.call_soon_threadsafe(queue.put_nowait, (event, session))
+
+    def run(self):
+        """Poll until stop() is called"""
+        while not self._stop.is_set():
+            try:
+                self.poll()
+            except Exception as e:
+                # get_activity failed, callback errors never get here
+                self.interval = self.idle_interval
+                self._emit('error', e)
+            self._stop.wait(self.interval)
+
+    def start(self):
+        """Poll in a background thread"""
+        self._stop.clear()
+        self._thread = threading.Thread(target=self.run, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        """Stop the background thread"""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
@@ -0,0 +1,194 @@
+"""
+HistoryAggregator class
+"""
+import time
+from collections import defaultdict
+from datetime import datetime
+from lazy import optional
+
+
+# Graph series names used by Tautulli
+MEDIA_SERIES = {'episode': 'TV', 'movie': 'Movies', 'track': 'Music'}
+STREAM_SERIES = {'direct play': 'Direct Play', 'copy': 'Direct Stream',
+                 'transcode': 'Transcode'}
+DAYS = ('Sunday', 'Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday',
+        'Saturday')
+HOURS = tuple('{:02d}'.format(hour) for hour in range(24))
+# Category of rows missing a field
+UNKNOWN = 'Unknown'
+
+
+def group_sum(categories, series, weights):
+    """
+    Sum `weights` grouped by (category, series).
+
+    Returns {(category, series): total}, vectorized with NumPy when
+    installed. Keys must be strings.
+    """
+    numpy = optional('numpy')
+    if numpy is None or not weights:
+        totals = defaultdict(int)
+        for category, name, weight in zip(categories, series, weights):
+            totals[(category, name)] += weight
+        return dict(totals)
+    cat_keys, cat_idx = numpy.unique(numpy.array(categories, dtype=str),
+                                     return_inverse=True)
+    ser_keys, ser_idx = numpy.unique(numpy.array(series, dtype=str),
+                                     return_inverse=True)
+    sums = numpy.bincount(cat_idx * len(ser_keys) + ser_idx,
+                          weights=numpy.asarray(weights, dtype=numpy.float64),
+                          minlength=len(cat_keys) * len(ser_keys))
+    return {(str(cat_keys[i // len(ser_keys)]),
+             str(ser_keys[i % len(ser_keys)])): int(total)
+            for i, total in enumerate(sums) if total}
+
+
+class HistoryAggregator:
+    """
+    Client-side get_plays_by_*/get_home_stats breakdowns of history
+
+    get_history rows carry no video resolution, so the source/stream
+    resolution breakdowns are left to the server.
+    """
+
+    def __init__(self, rows):
+        """HistoryAggregator constructor, reads `rows` in a single pass"""
+        self.dates = []
+        self.months = []
+        self.days = []
+        self.hours = []
+        self.media = []
+        self.streams = []
+        self.platforms = []
+        self.users = []
+        self.durations = []
+        for row in rows:
+            started = datetime.fromtimestamp(
+                row.get('started') or row.get('date') or 0)
+            self.dates.append(started.strftime('%Y-%m-%d'))
+            self.months.append(started.strftime('%b %Y'))
+            self.days.append(DAYS[started.isoweekday() % 7])
+            self.hours.append(HOURS[started.hour])
+            media_type = row.get('media_type') or UNKNOWN
+            self.media.append(MEDIA_SERIES.get(media_type, media_type))
+            decision = row.get('transcode_decision') or UNKNOWN
+            self.streams.append(STREAM_SERIES.get(decision, decision))
+            self.platforms.append(row.get('platform') or UNKNOWN)
+            self.users.append(row.get('friendly_name') or row.get('user')
+                              or UNKNOWN)
+            self.durations.append(row.get('duration') or 0)
+        self.plays = [1] * len(self.durations)
+
+    @classmethod
+    def from_tautulli(cls, tautulli, time_range=30, page_size=1000,
+                      **filters):
+        """
+        Build from one streamed get_history pull.
+
+        Optional parameters:
+            time_range (int):       The number of days of history to read,
+                                    None for all history, default: 30
+            page_size (int):        Rows per request, default: 1000
+            **filters:              Any get_history() filter (user_id, ...)
+        """
+        rows = tautulli.paginate('get_history', page_size=page_size,
+                                 order_column='started', order_dir='desc',
+                                 **filters)
+        if time_range is not None:
+            cutoff = time.time() - time_range * 86400
+            rows = _until(rows, lambda row: (row.get('started') or 0)
+                          < cutoff)
+        return cls(rows)
+
+    def _weights(self, y_axis):
+        return self.durations if y_axis == 'duration' else self.plays
+
+    @staticmethod
+    def _graph(categories, series, weights, order=None, top=None):
+        """
+        Return Tautulli graph data {"categories": [], "series": []}.
+
+        Categories follow `order` if given, else the `top` categories by
+        total in descending order.
+        """
+        totals = group_sum(categories, series, weights)
+        if order is None:
+            by_category = defaultdict(int)
+            for (category, _), total in totals.items():
+                by_category[category] += total
+            order = sorted(by_category,
+                           key=lambda c: (-by_category[c], c))[:top]
+        names = sorted(set(name for _, name in totals))
+        return {'categories': list(order),
+                'series': [{'name': name,
+                            'data': [totals.get((c, name), 0)
+                                     for c in order]}
+                           for name in names]}
+
+    def plays_by_date(self, y_axis='plays'):
+        """Breakdown as get_plays_by_date"""
+        return self._graph(self.dates, self.media, self._weights(y_axis),
+                           order=sorted(set(self.dates)))
+
+    def plays_by_dayofweek(self, y_axis='plays'):
+        """Breakdown as get_plays_by_dayofweek"""
+        return self._graph(self.days, self.media, self._weights(y_axis),
+                           order=DAYS)
+
+    def plays_by_hourofday(self, y_axis='plays'):
+        """Breakdown as get_plays_by_hourofday"""
+        return self._graph(self.hours, self.media, self._weights(y_axis),
+                           order=HOURS)
+
+    def plays_per_month(self, y_axis='plays'):
+        """Breakdown as get_plays_per_month"""
+        months = sorted(set(self.months),
+                        key=lambda m: datetime.strptime(m, '%b %Y'))
+        return self._graph(self.months, self.media, self._weights(y_axis),
+                           order=months)
+
+    def plays_by_top_10_platforms(self, y_axis='plays'):
+        """Breakdown as get_plays_by_top_10_platforms"""
+        return self._graph(self.platforms, self.media,
+                           self._weights(y_axis), top=10)
+
+    def plays_by_top_10_users(self, y_axis='plays'):
+        """Breakdown as get_plays_by_top_10_users"""
+        return self._graph(self.users, self.media, self._weights(y_axis),
+                           top=10)
+
+    def plays_by_stream_type(self, y_axis='plays'):
+        """Breakdown as get_plays_by_stream_type"""
+        return self._graph(self.dates, self.streams, self._weights(y_axis),
+                           order=sorted(set(self.dates)))
+
+    def stream_type_by_top_10_platforms(self, y_axis='plays'):
+        """Breakdown as get_stream_type_by_top_10_platforms"""
+        return self._graph(self.platforms, self.streams,
+                           self._weights(y_axis), top=10)
+
+    def stream_type_by_top_10_users(self, y_axis='plays'):
+        """Breakdown as get_stream_type_by_top_10_users"""
+        return self._graph(self.users, self.streams, self._weights(y_axis),
+                           top=10)
+
+    def top_users(self, count=5):
+        """Most active users as get_home_stats "top_users" rows"""
+        series = [''] * len(self.users)
+        plays = group_sum(self.users, series, self.plays)
+        durations = group_sum(self.users, series, self.durations)
+        top = sorted(plays, key=lambda key: (-plays[key], key))[:count]
+        return [{'friendly_name': user, 'total_plays': plays[(user, '')],
+                 'total_duration': durations.get((user, ''), 0)}
+                for user, _ in top]
+
+
+def _until(rows, stop):
+    """Yield rows until `stop(row)` is true, closing the source"""
+    try:
+        for row in rows:
+            if stop(row):
+                break
+            yield row
+    finally:
+        rows.close()
@@ -0,0 +1,159 @@
+"""
+AsyncTautulli class
+"""
+import asyncio
+import io
+from functools import partial
+from paginator import AsyncPaginator
+from payload import payload_key
+from requester import (AsyncRequester, new_async_session,
+                       projecting_decoder)
+from resilience import is_idempotent
+from singleflight import AsyncSingleFlight
+from tautulli import BatchResult, Tautulli
+
+
+class AsyncTautulli(Tautulli):
+    """
+    Asyncio Tautulli class
+
+    Mirrors every Tautulli API method, each returning an awaitable:
+
+        async with AsyncTautulli(host="localhost", apikey="...") as tautulli:
+            activity = await tautulli.get_activity()
+
+    The response cache and image cache (`cache=`, `image_cache=`) are
+    not supported, their lookups are blocking.
+    """
+
+    def __init__(self, host=None, port=None, apikey=None, schema=None,
+                 path=None, pool_maxsize=10, limit_per_host=0,
+                 max_concurrency=10, validate=False, decoder=None,
+                 timeout=(10, 60), timeouts=None, retry=True,
+                 breaker=False, coalesce=False, metrics=None):
+        super().__init__(host=host, port=port, apikey=apikey, schema=schema,
+                         path=path, validate=validate, decoder=decoder,
+                         timeout=timeout, timeouts=timeouts, retry=retry,
+                         breaker=breaker, metrics=metrics)
+        # Share one request among identical concurrent read commands
+        self.singleflight = AsyncSingleFlight() if coalesce else None
+        # Connector limits, the session is opened inside the running loop
+        self.pool_maxsize = pool_maxsize
+        self.limit_per_host = limit_per_host
+        # Bounds the number of in-flight commands
+        self.semaphore = asyncio.Semaphore(max_concurrency)
+
+    def _open_session(self, pool_connections, pool_maxsize, pool_block):
+        """Defer the aiohttp session until the first command"""
+        return None
+
+    def __enter__(self):
+        raise TypeError("use 'async with' with AsyncTautulli")
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        pass
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
+
+    async def close(self):
+        """Close the pooled session and its open connections"""
+        if self.session is not None:
+            await self.session.close()
+            self.session = None
+
+    def _connect(self):
+        """Open the aiohttp session inside the running event loop"""
+        if self.session is None:
+            self.session = new_async_session(
+                limit=self.pool_maxsize, limit_per_host=self.limit_per_host)
+
+    def _requester(self, payload, decoder=None):
+        """Return a requester for a payload over the shared session"""
+        return AsyncRequester(self.url, payload, session=self.session,
+                              decoder=decoder or self.decoder,
+                              timeout=self.timeouts.get(payload['cmd'],
+                                                        self.timeout),
+                              retry=self.retry, breaker=self.breaker,
+                              metrics=self.metrics)
+
+    async def _cmd(self, pprint=False, as_columns=False, as_records=False,
+                   fields=None, **params):
+        """Sends and receives API command"""
+        payload = self._payload(params)
+        self._connect()
+        if fields is not None:
+            # Projected responses are neither shared nor cached
+            r = await self._get(payload,
+                                projecting_decoder(fields, self.decoder))
+        elif (self.singleflight is not None
+              and is_idempotent(payload['cmd'])):
+            r = await self.singleflight.do(payload_key(payload),
+                                           partial(self._get, payload))
+        else:
+            r = await self._get(payload)
+        return self._result(payload['cmd'], r, pprint, as_columns,
+                            as_records)
+
+    async def _get(self, payload, decoder=None):
+        """Send a payload once a concurrency slot is free"""
+        async with self.semaphore:
+            return await self._requester(payload, decoder=decoder).get()
+
+    async def _download(self, dest=None, chunk_size=1024 * 1024,
+                        progress=None, resume=False, **params):
+        """Streams a file-returning API command to `dest`"""
+        payload = self._payload(params)
+        self._connect()
+        async with self.semaphore:
+            requester = self._requester(payload)
+            if dest is None:
+                buffer = io.BytesIO()
+                await requester.download(buffer, chunk_size=chunk_size,
+                                         progress=progress, resume=resume)
+                return buffer.getvalue()
+            return await requester.download(dest, chunk_size=chunk_size,
+                                            progress=progress, resume=resume)
+
+    def paginate(self, cmd, page_size=100, workers=1, **params):
+        """
+        Tautulli.paginate() as an async iterator, also used by
+        iter_history():
+
+            async for row in tautulli.iter_history(page_size=500):
+                ...
+        """
+        return AsyncPaginator(self, cmd, page_size=page_size,
+                              workers=workers, **params)
+
+    async def fetch_all(self, cmd, workers=4, page_size=1000, **params):
+        """Awaitable Tautulli.fetch_all(), pages are requested as tasks"""
+        return await AsyncPaginator(self, cmd, page_size=page_size,
+                                    workers=workers, **params).fetch_all()
+
+    async def batch(self, commands, workers=8):
+        """Awaitable Tautulli.batch(), `workers` commands run at a time"""
+        commands = self._batch_commands(commands)
+        slots = asyncio.Semaphore(max(1, workers))
+
+        async def run(cmd, params):
+            async with slots:
+                try:
+                    return BatchResult(cmd, params,
+                                       await getattr(self, cmd)(**params),
+                                       None)
+                except Exception as e:
+                    return BatchResult(cmd, params, None, e)
+
+        return list(await asyncio.gather(
+            *(run(cmd, params) for cmd, params in commands)))
+
+    async def get_server_id(self, hostname='localhost', port=32400,
+                            ssl=None, remote=None):
+        """Awaitable Tautulli.get_server_id(), returns the identifier"""
+        r = await self._cmd(cmd='get_server_id', hostname=hostname,
+                            port=port, ssl=ssl, remote=remote)
+        return r['response']['data']['identifier']
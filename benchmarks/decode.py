@@ -0,0 +1,88 @@
+"""
+JSON decode benchmark
+
+Times each available decoder on synthetic get_activity/get_history
+responses (get_history also projected to six fields) and reports decode
+time and peak memory per command:
+
+    python benchmarks/decode.py [--rows 20000] [--repeat 5]
+"""
+import argparse
+import json
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from lazy import optional  # noqa: E402
+from requester import projecting_decoder  # noqa: E402
+from benchmarks.mock_server import (  # noqa: E402
+    activity_sessions, envelope, history_rows)
+
+
+# Row fields kept by the projecting decoder
+FIELDS = ('date', 'user_id', 'rating_key', 'media_type', 'duration',
+          'platform')
+
+
+def history_response(rows):
+    """Return a get_history response body with `rows` rows"""
+    return envelope({'recordsTotal': rows, 'recordsFiltered': rows,
+                     'draw': 1, 'data': history_rows(rows)})
+
+
+def activity_response(sessions):
+    """Return a get_activity response body with `sessions` sessions"""
+    return envelope({'stream_count': str(sessions),
+                     'sessions': activity_sessions(sessions)})
+
+
+def decoders(table=False):
+    """Return the decoders to compare, `table`: include field projection"""
+    yield 'str copy + json', lambda b: json.loads(b.decode('utf-8'))
+    # Still decoded to a str inside json.loads, same peak as above
+    yield 'json (bytes)', json.loads
+    orjson = optional('orjson')
+    if orjson is not None:
+        yield 'orjson', orjson.loads
+    if table:
+        yield 'json + fields', projecting_decoder(FIELDS, json.loads)
+        if orjson is not None:
+            yield 'orjson + fields', projecting_decoder(FIELDS, orjson.loads)
+
+
+def measure(decoder, body, repeat):
+    """Return (best seconds, peak bytes) of decoding `body`"""
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        decoder(body)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    tracemalloc.start()
+    decoder(body)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return best, peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument('--rows', type=int, default=20000)
+    parser.add_argument('--sessions', type=int, default=50)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+    bodies = [('get_history', history_response(args.rows)),
+              ('get_activity', activity_response(args.sessions))]
+    print('{:<14} {:<16} {:>10} {:>10} {:>12}'.format(
+        'command', 'decoder', 'body MB', 'ms', 'peak MB'))
+    for cmd, body in bodies:
+        for name, decoder in decoders(table=cmd == 'get_history'):
+            seconds, peak = measure(decoder, body, args.repeat)
+            print('{:<14} {:<16} {:>10.2f} {:>10.2f} {:>12.2f}'.format(
+                cmd, name, len(body) / 1e6, seconds * 1e3, peak / 1e6))
+
+
+if __name__ == '__main__':
+    main()
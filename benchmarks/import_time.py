@@ -0,0 +1,67 @@
+"""
+Import time benchmark
+
+Times `import tautulli` and the first `Tautulli()` in fresh interpreters,
+next to the same import with every dependency loaded up front (as before
+imports were deferred), and lists which heavy dependencies were loaded:
+
+    python benchmarks/import_time.py [--repeat 10]
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+# Dependencies that tautulli imports on first use only
+HEAVY = ('requests', 'jsonschema', 'aiohttp', 'numpy', 'orjson')
+
+# Runs in a fresh interpreter, prints {"seconds": ..., "loaded": [...]}
+SCRIPT = '''
+import json, sys, time
+start = time.perf_counter()
+{setup}
+import tautulli
+{construct}
+seconds = time.perf_counter() - start
+print(json.dumps({{'seconds': seconds, 'loaded': [
+    name for name in {heavy!r} if name in sys.modules]}}))
+'''
+
+SCENARIOS = (
+    ('import tautulli', '', ''),
+    ('import + Tautulli()', '',
+     "tautulli.Tautulli(host='localhost', apikey='x')"),
+    ('eager dependencies', '\n'.join(
+        'try:\n    import {}\nexcept ImportError:\n    pass'.format(name)
+        for name in HEAVY), ''),
+)
+
+
+def run(setup, construct):
+    """Return (seconds, loaded dependencies) of one fresh interpreter"""
+    script = SCRIPT.format(setup=setup, construct=construct, heavy=HEAVY)
+    out = subprocess.run([sys.executable, '-c', script], cwd=ROOT,
+                         stdout=subprocess.PIPE, check=True).stdout
+    result = json.loads(out)
+    return result['seconds'], result['loaded']
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument('--repeat', type=int, default=10)
+    args = parser.parse_args()
+    print('{:<22} {:>10} {:>10}  {}'.format(
+        'scenario', 'p50 ms', 'min ms', 'loaded'))
+    for name, setup, construct in SCENARIOS:
+        runs = [run(setup, construct) for _ in range(args.repeat)]
+        times = [seconds * 1e3 for seconds, _ in runs]
+        print('{:<22} {:>10.1f} {:>10.1f}  {}'.format(
+            name, statistics.median(times), min(times),
+            ', '.join(runs[0][1]) or '-'))
+
+
+if __name__ == '__main__':
+    main()
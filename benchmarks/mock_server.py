@@ -0,0 +1,208 @@
+"""
+Local stand-in Tautulli server for benchmarks
+
+Serves canned get_activity, get_history, get_metadata, pms_image_proxy
+and download_* responses on /api/v2, optionally slowed down or failing
+(see MockTautulli), for benchmarks and the offline tests:
+
+    python benchmarks/mock_server.py [--port 8181] [--rows 40000]
+"""
+import argparse
+import json
+import threading
+import time
+from collections import Counter, deque
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from urllib.parse import urlparse, parse_qs
+
+
+# ETag of the pms_image_proxy image
+IMAGE_ETAG = '"mock-image"'
+
+
+def history_rows(count):
+    """Return `count` get_history rows, newest first"""
+    return [{'date': 1462687607 + i, 'duration': 263,
+             'friendly_name': 'Mother of Dragons',
+             'full_title': 'Game of Thrones - The Red Woman',
+             'grandparent_rating_key': 351, 'group_count': 1,
+             'group_ids': str(i), 'id': i,
+             'ip_address': '10.0.0.{}'.format(i % 255), 'media_index': 17,
+             'media_type': ('episode', 'movie', 'track')[i % 3],
+             'parent_rating_key': 544, 'paused_counter': 0,
+             'percent_complete': 84,
+             'platform': ('Chrome', 'Android', 'Roku')[i % 3],
+             'player': 'Plex Web (Chrome)', 'rating_key': 4348 + i,
+             'reference_id': i, 'session_key': None,
+             'started': 1462688107 + i * 600, 'state': None,
+             'stopped': 1462688370 + i * 600,
+             'thumb': '/library/metadata/4348/thumb/1462414561',
+             'title': 'The Red Woman',
+             'transcode_decision': ('direct play', 'copy', 'transcode')[i % 3],
+             'user': 'DanyKhaleesi69', 'user_id': i % 20,
+             'watched_status': 0, 'year': 2016}
+            for i in range(count, 0, -1)]
+
+
+def activity_sessions(count):
+    """Return `count` get_activity sessions of ~150 keys each"""
+    session = {'field_{}'.format(i): 'value {}'.format(i)
+               for i in range(140)}
+    return [dict(session, session_key=i, state='playing',
+                 transcode_decision='transcode', video_decision='transcode',
+                 full_title='Game of Thrones - The Red Woman',
+                 progress_percent=i % 100, user_id=i % 20)
+            for i in range(count)]
+
+
+def envelope(data):
+    """Return a JSON API response body"""
+    return json.dumps({'response': {'result': 'success', 'message': None,
+                                    'data': data}}).encode('utf-8')
+
+
+class MockTautulli:
+    """Threaded HTTP server answering canned API responses"""
+
+    def __init__(self, port=0, rows=10000, sessions=20, image_bytes=65536,
+                 file_bytes=65536):
+        """MockTautulli constructor"""
+        self.rows = history_rows(rows)
+        self.activity = envelope({'stream_count': str(sessions),
+                                  'sessions': activity_sessions(sessions)})
+        self.image = bytes(range(256)) * (image_bytes // 256)
+        # Body of the download_* commands
+        self.file = bytes(range(256))[::-1] * (file_bytes // 256)
+        # Answer "Range: bytes=<offset>-" download requests with 206/416
+        self.ranges = True
+        # Requests received per command
+        self.requests = Counter()
+        # Statuses answered to the next requests instead of the response
+        self.fail = deque()
+        # Seconds every response is held back
+        self.delay = 0
+        self._lock = threading.Lock()
+        self.server = ThreadingHTTPServer(('127.0.0.1', port),
+                                          self._handler())
+        self.server.daemon_threads = True
+        self.port = self.server.server_address[1]
+
+    def _handler(self):
+        mock = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+            # Headers and body go out in separate writes
+            disable_nagle_algorithm = True
+
+            def log_message(self, *args):
+                pass
+
+            def do_GET(self):
+                query = {k: v[0] for k, v in
+                         parse_qs(urlparse(self.path).query).items()}
+                with mock._lock:
+                    mock.requests[query.get('cmd')] += 1
+                    status = mock.fail.popleft() if mock.fail else 200
+                if mock.delay:
+                    time.sleep(mock.delay)
+                headers = {}
+                if status == 200:
+                    body, content_type = mock.respond(query)
+                    offset = self.headers.get('Range', '')
+                    if mock.ranges and offset.startswith('bytes=') and \
+                            query.get('cmd', '').startswith('download_'):
+                        status, body, headers = mock.range(
+                            body, int(offset[6:].rstrip('-')))
+                    if query.get('cmd') == 'pms_image_proxy':
+                        # Images revalidate with If-None-Match
+                        headers = {'ETag': IMAGE_ETAG}
+                        if self.headers.get('If-None-Match') == IMAGE_ETAG:
+                            status, body = 304, b''
+                else:
+                    body, content_type = b'', 'text/plain'
+                self.send_response(status)
+                self.send_header('Content-Type', content_type)
+                for name, value in headers.items():
+                    self.send_header(name, value)
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                try:
+                    self.wfile.write(body)
+                except (BrokenPipeError, ConnectionResetError):
+                    # Client gave up, e.g. on a read timeout
+                    pass
+
+        return Handler
+
+    def respond(self, query):
+        """Return (body, content type) of an API request"""
+        cmd = query.get('cmd')
+        if cmd == 'get_activity':
+            return self.activity, 'application/json'
+        if cmd == 'pms_image_proxy':
+            return self.image, 'image/jpeg'
+        if cmd == 'get_history':
+            start = int(query.get('start') or 0)
+            length = int(query.get('length') or 25)
+            return envelope({'draw': 1, 'recordsTotal': len(self.rows),
+                             'recordsFiltered': len(self.rows),
+                             'data': self.rows[start:start + length]}
+                            ), 'application/json'
+        if cmd == 'get_metadata':
+            return envelope({'rating_key': query.get('rating_key'),
+                             'title': 'The Red Woman',
+                             'media_type': 'episode', 'year': 2016,
+                             'summary': 'x' * 1000}), 'application/json'
+        if (cmd or '').startswith('download_'):
+            return self.file, 'application/octet-stream'
+        return envelope({}), 'application/json'
+
+    @staticmethod
+    def range(body, offset):
+        """Return (status, body, headers) of a body from byte `offset`"""
+        if offset >= len(body):
+            return 416, b'', {'Content-Range': 'bytes */{}'.format(
+                len(body))}
+        return 206, body[offset:], {
+            'Content-Range': 'bytes {0}-{1}/{2}'.format(
+                offset, len(body) - 1, len(body))}
+
+    def reset(self):
+        """Forget counted requests, queued failures, delay and ranges"""
+        with self._lock:
+            self.requests.clear()
+            self.fail.clear()
+            self.delay = 0
+            self.ranges = True
+
+    def start(self):
+        """Serve in a background thread"""
+        threading.Thread(target=self.server.serve_forever,
+                         daemon=True).start()
+        return self
+
+    def stop(self):
+        """Stop serving"""
+        self.server.shutdown()
+        self.server.server_close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument('--port', type=int, default=8181)
+    parser.add_argument('--rows', type=int, default=10000)
+    parser.add_argument('--sessions', type=int, default=20)
+    args = parser.parse_args()
+    mock = MockTautulli(port=args.port, rows=args.rows,
+                        sessions=args.sessions)
+    # First line tells benchmark runners which port to use
+    print(mock.port, flush=True)
+    try:
+        mock.server.serve_forever()
+    except KeyboardInterrupt:
+        mock.stop()
+
+
+if __name__ == '__main__':
+    main()
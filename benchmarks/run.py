@@ -0,0 +1,149 @@
+"""
+Client benchmark suite
+
+Starts benchmarks/mock_server.py in a subprocess and measures throughput,
+p50/p99 latency and peak client memory of the single-call, batched,
+paginated and async paths:
+
+    python benchmarks/run.py [--rows 40000] [--requests 500] [--json]
+"""
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+from tautulli import Tautulli  # noqa: E402
+from lazy import optional  # noqa: E402
+
+
+def percentile(values, pct):
+    """Return the `pct` percentile of a list of values"""
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * pct / 100))]
+
+
+def measure(name, fn, operations):
+    """
+    Run `fn()`, returns a result dict.
+
+    `fn` returns per-operation latencies (seconds) or None when only the
+    total duration is meaningful.
+    """
+    tracemalloc.start()
+    start = time.perf_counter()
+    latencies = fn()
+    elapsed = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    result = {'name': name, 'operations': operations, 'seconds': elapsed,
+              'ops_per_second': operations / elapsed,
+              'peak_mb': peak / 1e6, 'p50_ms': None, 'p99_ms': None}
+    if latencies:
+        result['p50_ms'] = statistics.median(latencies) * 1e3
+        result['p99_ms'] = percentile(latencies, 99) * 1e3
+    return result
+
+
+def timed(calls):
+    """Run callables sequentially, returns their latencies"""
+    latencies = []
+    for call in calls:
+        start = time.perf_counter()
+        call()
+        latencies.append(time.perf_counter() - start)
+    return latencies
+
+
+def scenarios(tautulli, port, args):
+    """Yield (name, fn, operations) benchmark scenarios"""
+    n = args.requests
+
+    def batch():
+        tautulli.batch([('get_metadata', {'rating_key': i})
+                        for i in range(n)], workers=args.workers)
+
+    def iter_history():
+        for _ in tautulli.iter_history(page_size=args.page_size):
+            pass
+
+    def fetch_all():
+        tautulli.fetch_all('get_history', workers=args.workers,
+                           page_size=args.page_size)
+
+    yield 'get_activity', lambda: timed([tautulli.get_activity] * n), n
+    yield 'get_metadata', lambda: timed(
+        [lambda: tautulli.get_metadata(rating_key=1)] * n), n
+    yield 'pms_image_proxy', lambda: timed(
+        [lambda: tautulli.pms_image_proxy(rating_key=1)] * n), n
+    yield 'batch get_metadata', batch, n
+    yield 'iter_history', iter_history, args.rows
+    yield 'fetch_all get_history', fetch_all, args.rows
+    if optional('aiohttp') is not None:
+        yield 'async get_activity', lambda: asyncio.run(
+            async_activity(port, n, args.workers)), n
+
+
+async def async_activity(port, n, concurrency):
+    """
+    Run `n` concurrent get_activity calls, returns their latencies.
+
+    Latencies include the wait for one of `concurrency` request slots.
+    """
+    from async_tautulli import AsyncTautulli
+    async with AsyncTautulli(host='127.0.0.1', port=port, apikey='bench',
+                             schema='http', path='',
+                             max_concurrency=concurrency) as tautulli:
+        async def call():
+            start = time.perf_counter()
+            await tautulli.get_activity()
+            return time.perf_counter() - start
+        return await asyncio.gather(*[call() for _ in range(n)])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument('--rows', type=int, default=40000)
+    parser.add_argument('--sessions', type=int, default=20)
+    parser.add_argument('--requests', type=int, default=500)
+    parser.add_argument('--workers', type=int, default=8)
+    parser.add_argument('--page-size', type=int, default=1000)
+    parser.add_argument('--json', action='store_true',
+                        help='print results as JSON')
+    args = parser.parse_args()
+    server = subprocess.Popen(
+        [sys.executable, os.path.join(ROOT, 'benchmarks', 'mock_server.py'),
+         '--port', '0', '--rows', str(args.rows),
+         '--sessions', str(args.sessions)], stdout=subprocess.PIPE)
+    try:
+        port = int(server.stdout.readline())
+        results = []
+        with Tautulli(host='127.0.0.1', port=port, apikey='bench',
+                      schema='http', path='',
+                      pool_maxsize=args.workers) as tautulli:
+            for name, fn, operations in scenarios(tautulli, port, args):
+                results.append(measure(name, fn, operations))
+    finally:
+        server.terminate()
+        server.wait()
+    if args.json:
+        print(json.dumps(results, indent=4))
+        return
+    print('{:<28} {:>8} {:>10} {:>9} {:>9} {:>9}'.format(
+        'scenario', 'ops', 'ops/s', 'p50 ms', 'p99 ms', 'peak MB'))
+    for r in results:
+        print('{:<28} {:>8} {:>10.1f} {:>9} {:>9} {:>9.2f}'.format(
+            r['name'], r['operations'], r['ops_per_second'],
+            '-' if r['p50_ms'] is None else '{:.2f}'.format(r['p50_ms']),
+            '-' if r['p99_ms'] is None else '{:.2f}'.format(r['p99_ms']),
+            r['peak_mb']))
+
+
+if __name__ == '__main__':
+    main()
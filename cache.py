@@ -0,0 +1,107 @@
+"""
+ResponseCache class
+"""
+import threading
+import time
+from collections import OrderedDict
+from payload import payload_key
+
+
+# Default time-to-live (seconds) of near-static read-only commands
+DEFAULT_TTLS = {
+    'get_date_formats': 3600,
+    'get_libraries': 300,
+    'get_library_names': 300,
+    'get_server_friendly_name': 3600,
+    'get_server_identity': 3600,
+    'get_settings': 300,
+    'get_user_names': 300,
+}
+
+# Cached commands affected by library/user changes
+LIBRARY_CMDS = ('get_libraries', 'get_library_names', 'get_library',
+                'get_libraries_table', 'get_library_media_info')
+USER_CMDS = ('get_user_names', 'get_users', 'get_user', 'get_users_table')
+
+# Mutating commands and the cached commands they invalidate (None: all)
+INVALIDATES = {
+    'delete_all_library_history': LIBRARY_CMDS,
+    'delete_all_user_history': USER_CMDS,
+    'delete_library': LIBRARY_CMDS,
+    'delete_media_info_cache': LIBRARY_CMDS,
+    'delete_user': USER_CMDS,
+    'edit_library': LIBRARY_CMDS,
+    'edit_user': USER_CMDS,
+    'import_database': None,
+    'refresh_libraries_list': LIBRARY_CMDS,
+    'refresh_users_list': USER_CMDS,
+    'restart': None,
+    'undelete_library': LIBRARY_CMDS,
+    'undelete_user': USER_CMDS,
+    'update': None,
+}
+
+
+class ResponseCache:
+    """In-memory TTL/LRU cache of decoded API responses"""
+
+    def __init__(self, ttls=None, maxsize=256):
+        """ResponseCache constructor"""
+        # Only commands with a TTL are cached
+        self.ttls = dict(DEFAULT_TTLS if ttls is None else ttls)
+        self.maxsize = maxsize
+        # key -> (expiry, response), oldest first
+        self._entries = OrderedDict()
+        # Bumped by every invalidation, responses requested before one
+        # may predate the change and are not stored
+        self._generation = 0
+        self._lock = threading.Lock()
+
+    def fetch(self, payload, request):
+        """
+        Return the cached response of `payload` or call `request()`.
+
+        Responses are shared between callers and must be treated as
+        read-only.
+        """
+        cmd = payload['cmd']
+        if cmd in INVALIDATES:
+            try:
+                return request()
+            finally:
+                # Once the server has applied the change (or may have)
+                self.invalidate(*(INVALIDATES[cmd] or ()))
+        ttl = self.ttls.get(cmd)
+        if not ttl:
+            return request()
+        key = payload_key(payload)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] > time.monotonic():
+                self._entries.move_to_end(key)
+                return entry[1]
+            generation = self._generation
+        r = request()
+        with self._lock:
+            if generation != self._generation:
+                return r
+            self._entries[key] = (time.monotonic() + ttl, r)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return r
+
+    def invalidate(self, *cmds):
+        """Drop cached responses of the given commands (all if none given)"""
+        with self._lock:
+            self._generation += 1
+            if not cmds:
+                self._entries.clear()
+                return
+            for key in [key for key in self._entries
+                        if dict(key)['cmd'] in cmds]:
+                del self._entries[key]
+
+    def clear(self):
+        """Drop every cached response"""
+        self.invalidate()
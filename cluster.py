@@ -0,0 +1,247 @@
+"""
+TautulliCluster class
+"""
+import heapq
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from columnar import to_columns
+from commands import COMMANDS, parameters
+from exceptions import CommandError
+from records import to_records
+from requester import pretty
+from tautulli import Tautulli
+
+
+# Table commands sorted by the server when no order_column is given
+DEFAULT_ORDER = {'get_history': ('date', 'desc')}
+# Rows returned by DataTables commands without `length`
+DEFAULT_LENGTH = 25
+# Counters of dict responses added up across servers
+SUMMED_KEYS = ('recordsTotal', 'recordsFiltered', 'stream_count',
+               'stream_count_direct_play', 'stream_count_direct_stream',
+               'stream_count_transcode', 'total_bandwidth',
+               'lan_bandwidth', 'wan_bandwidth')
+
+
+def _sort_key(value):
+    """Order None, then numbers, then strings, as mixed rows can hold all"""
+    if value is None:
+        return 0, 0
+    if isinstance(value, (int, float)):
+        return 1, value
+    return 2, str(value)
+
+
+def _total(values):
+    """Add up int or numeric str counters, keeping the type"""
+    if all(isinstance(value, (int, float)) for value in values):
+        return sum(values)
+    try:
+        return str(sum(int(value) for value in values))
+    except (TypeError, ValueError):
+        return values[0]
+
+
+class TautulliCluster:
+    """
+    Multi-server fan-out class
+
+    Every command runs on all servers concurrently, so a call takes as long
+    as the slowest server. Responses are merged into one Tautulli-style
+    response: rows are tagged with their server name (`server_key`),
+    DataTables rows are merged in `order_column`/`order_dir` order and
+    counters such as "stream_count" are added up. A failing server only
+    adds an entry to ["response"]["errors"].
+
+        cluster = TautulliCluster({
+            "east": Tautulli(host="10.0.0.1", apikey="..."),
+            "west": {"host": "10.0.0.2", "apikey": "..."}})
+        sessions = cluster.get_activity()['response']['data']['sessions']
+    """
+
+    def __init__(self, servers, workers=None, server_key='server'):
+        """
+        TautulliCluster constructor
+
+        Required parameters:
+            servers (dict):     Server name -> Tautulli object, or
+                                Tautulli() keyword parameters
+
+        Optional parameters:
+            workers (int):      Number of concurrent requests,
+                                default: one per server
+            server_key (str):   Row key holding the server name,
+                                default: "server"
+        """
+        # Server name -> Tautulli, in the order given
+        self.servers = {
+            name: server if isinstance(server, Tautulli)
+            else Tautulli(**server) for name, server in servers.items()}
+        self.workers = workers or max(1, len(self.servers))
+        self.server_key = server_key
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        """Close the sessions of every server"""
+        for server in self.servers.values():
+            server.close()
+
+    def __getattr__(self, name):
+        # cluster.<command>(**params) runs the command everywhere
+        if name not in COMMANDS:
+            raise AttributeError("'{0}' object has no attribute "
+                                 "'{1}'".format(type(self).__name__, name))
+        return partial(self.run, name)
+
+    def __dir__(self):
+        return sorted(set(super().__dir__()) | set(COMMANDS))
+
+    def fan_out(self, cmd, **params):
+        """
+        Run an API command on every server.
+
+        Required parameters:
+            cmd (str):      The API command, e.g. "get_activity"
+
+        Returns:
+            ({name: response}, {name: exception}) of the servers that
+            answered and of those that failed
+
+        Example usage:
+            responses, errors = cluster.fan_out("get_server_info")
+        """
+        def run(name):
+            try:
+                r = getattr(self.servers[name], cmd)(**params)
+                if r['response'].get('result') == 'error':
+                    raise CommandError(cmd, r['response'].get('message'))
+                return name, r, None
+            except Exception as e:
+                return name, None, e
+
+        responses, errors = {}, {}
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            for name, r, error in executor.map(run, self.servers):
+                if error is None:
+                    responses[name] = r
+                else:
+                    errors[name] = error
+        return responses, errors
+
+    def run(self, cmd, pprint=False, as_columns=False, as_records=False,
+            **params):
+        """
+        Run an API command on every server and merge the responses.
+
+        List and DataTables rows are combined and tagged with their
+        server, DataTables rows in `order_column`/`order_dir` order (for
+        get_history by default "date" "desc"). With `start`/`length`, the
+        first start + length rows of every server are merged, so pages
+        are pages of the combined table. Other responses are returned as
+        {server name: data}.
+
+        Required parameters:
+            cmd (str):          The API command, e.g. "get_history"
+
+        Optional parameters:
+            pprint (bool):      Return pretty-printed JSON
+            as_columns (bool):  Return the merged rows as column arrays
+            as_records (bool):  Return the merged rows as record objects
+            Any parameter of the command
+
+        Returns:
+            json:
+                {"response":
+                    {"result": "success" unless every server failed,
+                     "message": None or the failures, joined,
+                     "errors": {server name: "exception message"},
+                     "data": merged data
+                     }
+                 }
+
+        Example usage:
+            run("get_history", order_column="duration", length=50)
+        """
+        start = length = None
+        if 'length' in dict(parameters(cmd)):
+            start = params.pop('start', None) or 0
+            length = params.pop('length', None) or DEFAULT_LENGTH
+            # Rows before the combined page can come from any server
+            params['length'] = start + length
+        order_column = params.get('order_column') or DEFAULT_ORDER.get(
+            cmd, (None,))[0]
+        fields = params.get('fields')
+        added = None
+        if fields is not None and order_column not in (None, *fields):
+            # The merge needs the order column of every row
+            params['fields'] = list(fields) + [order_column]
+            added = order_column
+        responses, errors = self.fan_out(cmd, **params)
+        data = self._merge(
+            cmd, {name: r['response']['data']
+                  for name, r in responses.items()},
+            params.get('order_column'), params.get('order_dir'))
+        if length is not None and isinstance(data, dict) and isinstance(
+                data.get('data'), list):
+            data['data'] = data['data'][start:start + length]
+        if added is not None and isinstance(data, dict) and isinstance(
+                data.get('data'), list):
+            # Rows are tagged copies, the responses are left untouched
+            for row in data['data']:
+                row.pop(added, None)
+        messages = ['{0}: {1}'.format(name, error)
+                    for name, error in errors.items()]
+        r = {'response': {
+            'result': 'error' if errors and not responses else 'success',
+            'message': '; '.join(messages) or None,
+            'errors': {name: str(error) for name, error in errors.items()},
+            'data': data}}
+        if as_records:
+            return to_records(cmd, r)
+        if as_columns:
+            return to_columns(r)
+        return pretty(r) if pprint else r
+
+    def _tag(self, name, rows):
+        """Copy rows adding their server name, responses may be cached"""
+        key = self.server_key
+        return [dict(row, **{key: name}) if isinstance(row, dict) else row
+                for row in rows]
+
+    def _merge(self, cmd, data, order_column=None, order_dir=None):
+        """Merge the response data of each server"""
+        values = list(data.values())
+        if not values:
+            return None
+        if all(isinstance(value, list) for value in values):
+            return [row for name, rows in data.items()
+                    for row in self._tag(name, rows)]
+        if not all(isinstance(value, dict) for value in values):
+            return data
+        rows_key = next((key for key in ('data', 'sessions')
+                         if all(isinstance(value.get(key), list)
+                                for value in values)), None)
+        if rows_key is None:
+            return data
+        merged = dict(values[0])
+        for key in SUMMED_KEYS:
+            if all(key in value for value in values):
+                merged[key] = _total([value[key] for value in values])
+        rows = [self._tag(name, value[rows_key])
+                for name, value in data.items()]
+        if order_column is None and cmd in DEFAULT_ORDER:
+            order_column, default_dir = DEFAULT_ORDER[cmd]
+            order_dir = order_dir or default_dir
+        if rows_key == 'data' and order_column is not None:
+            # Each server returns its rows sorted, a k-way merge keeps it so
+            merged[rows_key] = list(heapq.merge(
+                *rows, key=lambda row: _sort_key(row.get(order_column)),
+                reverse=order_dir != 'asc'))
+        else:
+            merged[rows_key] = [row for part in rows for row in part]
+        return merged
@@ -0,0 +1,63 @@
+"""
+Column-oriented result conversion
+"""
+from array import array
+from lazy import optional
+
+
+def column(values):
+    """
+    Return a list of values as a typed array.
+
+    Integer columns become int64, numeric columns with floats become
+    float64 (NumPy arrays when installed, else array.array). Anything
+    else (strings, None) stays a list.
+    """
+    kind = 'q'
+    for value in values:
+        if type(value) is float:
+            kind = 'd'
+        elif type(value) is not int:
+            return values
+    numpy = optional('numpy')
+    if numpy is not None:
+        return numpy.array(values,
+                           dtype=numpy.int64 if kind == 'q' else numpy.float64)
+    return array(kind, values)
+
+
+def rows_to_columns(rows):
+    """Return {field: column} of a list of row dicts"""
+    columns = {}
+    for i, row in enumerate(rows):
+        for key, value in row.items():
+            values = columns.get(key)
+            if values is None:
+                # Field missing from earlier rows
+                values = columns[key] = [None] * i
+            values.append(value)
+        for values in columns.values():
+            if len(values) <= i:
+                values.append(None)
+    return {key: column(values) for key, values in columns.items()}
+
+
+def graph_to_columns(data):
+    """Return graph data with each series as {name: column}"""
+    return {'categories': data['categories'],
+            'series': {series['name']: column(series['data'])
+                       for series in data['series']}}
+
+
+def to_columns(r):
+    """
+    Return an API response with its table rows or graph series as columns.
+
+    The response itself is not modified.
+    """
+    data = r['response']['data']
+    if isinstance(data, dict) and 'series' in data:
+        data = graph_to_columns(data)
+    elif isinstance(data, dict) and isinstance(data.get('data'), list):
+        data = dict(data, data=rows_to_columns(data['data']))
+    return {'response': dict(r['response'], data=data)}
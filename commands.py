@@ -0,0 +1,176 @@
+"""
+Tautulli API command registry
+
+Every plain API wrapper method of Tautulli is defined here once and
+compiled into a method the first time it is looked up.
+"""
+
+# Command -> parameters of its Tautulli method, in signature order.
+# "name" defaults to None, "name=value" to the Python literal value and
+# "**name" collects any extra keyword parameters.
+COMMANDS = {
+    'add_newsletter_config': 'agent_id',
+    'add_notifier_config': 'agent_id',
+    'arnold': '',
+    'backup_config': '',
+    'backup_db': '',
+    'delete_all_library_history': 'section_id',
+    'delete_all_user_history': 'user_id',
+    'delete_cache': '',
+    'delete_hosted_images': 'rating_key service delete_all',
+    'delete_image_cache': '',
+    'delete_library': 'section_id',
+    'delete_login_log': '',
+    'delete_lookup_info': 'rating_key',
+    'delete_media_info_cache': 'section_id',
+    'delete_mobile_device': 'mobile_device_id',
+    'delete_newsletter': 'newsletter_id',
+    'delete_newsletter_log': '',
+    'delete_notification_log': '',
+    'delete_notifier': 'notifier_id',
+    'delete_temp_sessions': '',
+    'delete_user': 'user_id',
+    'docs': 'pprint=False',
+    'docs_md': '',
+    'edit_library': 'section_id custom_thumb keep_history',
+    'edit_user': 'user_id friendly_name custom_thumb keep_history allow_guest',
+    'get_activity': ('pprint=False session_key session_id '
+                     'as_records=False'),
+    'get_apikey': 'pprint=False username password',
+    'get_date_formats': 'pprint=False',
+    'get_geoip_lookup': 'pprint=False ip_address',
+    'get_history': ('pprint=False grouping user user_id rating_key '
+                    'parent_rating_key grandparent_rating_key start_date '
+                    'section_id media_type transcode_decision order_column '
+                    'order_dir start length search as_columns=False '
+                    'as_records=False fields'),
+    'get_home_stats': ('pprint=False grouping time_range stats_type '
+                       'stats_count'),
+    'get_libraries': 'pprint=False',
+    'get_libraries_table': ('pprint=False order_column order_dir start '
+                            'length search fields'),
+    'get_library': 'pprint=False section_id',
+    'get_library_media_info': ('pprint=False section_id rating_key '
+                               'section_type order_column order_dir start '
+                               'length search refresh as_records=False '
+                               'fields'),
+    'get_library_names': 'pprint=False',
+    'get_library_user_stats': 'pprint=False section_id grouping',
+    'get_library_watch_time_stats': 'pprint=False section_id grouping',
+    'get_logs': 'pprint=False sort search order regex start end',
+    'get_metadata': 'pprint=False rating_key',
+    'get_new_rating_keys': 'pprint=False rating_key media_type',
+    'get_newsletter_config': 'pprint=False newsletter_id',
+    'get_newsletter_log': ('pprint=False order_column order_dir start length '
+                           'search fields'),
+    'get_newsletters': 'pprint=False',
+    'get_notification_log': ('pprint=False order_column order_dir start '
+                             'length search fields'),
+    'get_notifier_config': 'pprint=False notifier_id',
+    'get_notifier_parameters': 'pprint=False',
+    'get_notifiers': 'pprint=False notify_action',
+    'get_old_rating_keys': 'pprint=False rating_key media_type',
+    'get_plays_by_date': ('pprint=False time_range y_axis user_id grouping '
+                          'as_columns=False'),
+    'get_plays_by_dayofweek': ('pprint=False time_range y_axis user_id '
+                               'grouping as_columns=False'),
+    'get_plays_by_hourofday': ('pprint=False time_range y_axis user_id '
+                               'grouping as_columns=False'),
+    'get_plays_by_source_resolution': ('pprint=False time_range y_axis '
+                                       'user_id grouping as_columns=False'),
+    'get_plays_by_stream_resolution': ('pprint=False time_range y_axis '
+                                       'user_id grouping as_columns=False'),
+    'get_plays_by_stream_type': ('pprint=False time_range y_axis user_id '
+                                 'grouping as_columns=False'),
+    'get_plays_by_top_10_platforms': ('pprint=False time_range y_axis '
+                                      'user_id grouping as_columns=False'),
+    'get_plays_per_month': ('pprint=False time_range y_axis user_id grouping '
+                            'as_columns=False'),
+    'get_plex_log': 'pprint=False window log_type',
+    'get_pms_token': 'username password',
+    'get_pms_update': 'pprint=False',
+    'get_recently_added': 'pprint=False count=25 start media_type section_id',
+    'get_server_friendly_name': 'pprint=False',
+    'get_server_identity': 'pprint=False',
+    'get_server_list': 'pprint=False',
+    'get_server_pref': 'pprint=False pref',
+    'get_servers_info': 'pprint=False',
+    'get_settings': 'pprint=False key',
+    'get_stream_data': 'pprint=False row_id session_key as_records=False',
+    'get_stream_type_by_top_10_platforms': ('pprint=False time_range y_axis '
+                                            'user_id grouping '
+                                            'as_columns=False'),
+    'get_stream_type_by_top_10_users': ('pprint=False time_range y_axis '
+                                        'user_id grouping as_columns=False'),
+    'get_synced_items': 'pprint=False machine_id user_id',
+    'get_user': 'pprint=False user_id',
+    'get_user_ips': ('pprint=False user_id order_column order_dir start '
+                     'length search fields'),
+    'get_user_logins': ('pprint=False user_id order_column order_dir start '
+                        'length search fields'),
+    'get_user_names': 'pprint=False',
+    'get_user_player_stats': 'pprint=False user_id grouping',
+    'get_user_watch_time_stats': 'pprint=False user_id grouping',
+    'get_users': 'pprint=False',
+    'get_users_table': ('pprint=False order_column order_dir start length '
+                        'search fields'),
+    'get_whois_lookup': 'pprint=False ip_address',
+    'import_database': 'app database_path table_name import_ignore_interval',
+    'install_geoip_db': '',
+    'notify': 'pprint=False notifier_id subject body script_args',
+    'notify_newsletter': 'pprint=False newsletter_id subject body message',
+    'notify_recently_added': 'pprint=False rating_key notifier_id',
+    'refresh_libraries_list': '',
+    'refresh_users_list': '',
+    'register_device': 'device_name device_id friendly_name',
+    'restart': '',
+    'search': 'pprint=False query limit',
+    'set_mobile_device_config': 'mobile_device_id friendly_name',
+    'set_newsletter_config': ('newsletter_id agent_id newsletter_config '
+                              'newsletter_email **cfg_opts'),
+    'set_notifier_config': 'notifier_id agent_id **cfg_opts',
+    'sql': 'query',
+    'terminate_session': 'session_key session_id message',
+    'undelete_library': 'section_id section_name',
+    'undelete_user': 'user_id username',
+    'uninstall_geoip_db': '',
+    'update': '',
+    'update_check': 'pprint=False',
+    'update_metadata_details': 'old_rating_key new_rating_key media_type',
+}
+
+# Method source, every parameter is passed on to Tautulli._cmd()
+TEMPLATE = '''def {cmd}({args}):
+    return self._cmd(cmd={cmd!r}, {call})
+'''
+
+
+def parameters(cmd):
+    """Return [(name, default source)] of a command, default None for **"""
+    params = []
+    for param in COMMANDS[cmd].split():
+        name, _, default = param.partition('=')
+        params.append((name, None if name.startswith('**')
+                       else default or 'None'))
+    return params
+
+
+def materialize(cmd):
+    """Compile the Tautulli method of a command"""
+    params = parameters(cmd)
+    args = ['self'] + [name if default is None
+                       else '{}={}'.format(name, default)
+                       for name, default in params]
+    call = [name if default is None else '{0}={0}'.format(name)
+            for name, default in params]
+    namespace = {}
+    source = TEMPLATE.format(cmd=cmd, args=', '.join(args),
+                             call=', '.join(call))
+    exec(compile(source, '<command {}>'.format(cmd), 'exec'), namespace)
+    method = namespace[cmd]
+    method.__module__ = 'tautulli'
+    method.__qualname__ = 'Tautulli.' + cmd
+    # Docstrings are only loaded once a command is used
+    from command_docs import DOCS
+    method.__doc__ = DOCS.get(cmd)
+    return method
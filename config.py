@@ -1,12 +1,107 @@
+"""
+Configuration loading
+
+Settings resolve in order: explicit Tautulli() arguments, environment
+variables, then settings.ini. Nothing is read at import time; the
+environment and settings file are read on the first Tautulli() and
+cached (see reload()).
+"""
 import configparser
+import os
+import threading
+from exceptions import ConfigurationError
+
+
+# Settings file, relative to the working directory unless absolute,
+# the TAUTULLI_SETTINGS environment variable names another file
+SETTINGS_FILE = 'settings.ini'
+SECTION = 'USER_SETTINGS'
+# Setting -> environment variable overriding the settings file
+ENVIRON = {'host': 'TAUTULLI_HOST', 'port': 'TAUTULLI_PORT',
+           'api_key': 'TAUTULLI_API_KEY', 'schema': 'TAUTULLI_SCHEMA',
+           'path': 'TAUTULLI_PATH'}
+# Values of settings found nowhere else
+DEFAULTS = {'host': None, 'port': '8181', 'api_key': None,
+            'schema': 'http', 'path': ''}
+# Module constants of earlier versions -> setting
+CONSTANTS = {'HOST': 'host', 'PORT': 'port', 'API_KEY': 'api_key',
+             'SCHEMA': 'schema', 'PATH': 'path'}
+
+_settings = None
+_lock = threading.Lock()
+
+
+def settings():
+    """Return the environment/settings file values, read once"""
+    global _settings
+    if _settings is None:
+        with _lock:
+            if _settings is None:
+                _settings = _read()
+    return _settings
+
+
+def reload():
+    """Forget the cached settings, the next Tautulli() reads them again"""
+    global _settings
+    with _lock:
+        _settings = None
+
+
+def _read():
+    """Read the environment and settings file"""
+    parser = configparser.ConfigParser()
+    # A missing file or section leaves the environment and defaults
+    parser.read(os.environ.get('TAUTULLI_SETTINGS', SETTINGS_FILE))
+    section = parser[SECTION] if parser.has_section(SECTION) else {}
+    values = dict(DEFAULTS)
+    for key, variable in ENVIRON.items():
+        value = os.environ.get(variable)
+        if value is None:
+            value = section.get(key)
+            # Unfilled placeholders of the shipped settings.ini
+            if value is not None and value.startswith('#'):
+                value = None
+        if value is not None:
+            values[key] = value
+    return values
+
+
+def resolve(host=None, port=None, apikey=None, schema=None, path=None):
+    """
+    Resolve the Tautulli endpoint settings.
+
+    Optional parameters:
+        host (str):     Explicit values, None falls back to the
+        port (int):     environment, then settings.ini, then defaults
+        apikey (str):
+        schema (str):
+        path (str):
+
+    Returns:
+        (host, port, apikey, schema, path)
+
+    Raises:
+        exceptions.ConfigurationError: host or apikey is set nowhere
+
+    Example usage:
+        os.environ['TAUTULLI_API_KEY'] = '...'
+        host, port, apikey, schema, path = resolve(host='localhost')
+    """
+    values = settings()
+    for setting, argument, value in (('host', 'host', host),
+                                     ('api_key', 'apikey', apikey)):
+        if not (value or values[setting]):
+            raise ConfigurationError(setting, argument, ENVIRON[setting])
+    return (host or values['host'], port or values['port'],
+            apikey or values['api_key'], schema or values['schema'],
+            values['path'] if path is None else path)
 
 
-# ConfigParser Variables
-config = configparser.ConfigParser()
-config.read('settings.ini')
-# Settings File Variables
-HOST = config['USER_SETTINGS']['host']
-PORT = config['USER_SETTINGS']['port']
-API_KEY = config['USER_SETTINGS']['api_key']
-SCHEMA = config['USER_SETTINGS']['schema']
-PATH = config['USER_SETTINGS']['path']
+def __getattr__(name):
+    # HOST, PORT, ... are resolved on first access
+    try:
+        return settings()[CONSTANTS[name]]
+    except KeyError:
+        raise AttributeError("module 'config' has no attribute "
+                             "'{}'".format(name)) from None
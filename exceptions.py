@@ -0,0 +1,50 @@
+"""
+Tautulli exceptions
+"""
+
+
+class TautulliError(Exception):
+    """Base class of every Tautulli API wrapper error"""
+
+
+class PayloadValidationError(TautulliError, ValueError):
+    """Command payload rejected by its JSON schema"""
+
+    def __init__(self, cmd, message):
+        """PayloadValidationError constructor"""
+        super().__init__('{0}: {1}'.format(cmd, message))
+        self.cmd = cmd
+        self.message = message
+
+
+class ConfigurationError(TautulliError, ValueError):
+    """Endpoint setting missing from the arguments, environment and file"""
+
+    def __init__(self, setting, argument, variable):
+        """ConfigurationError constructor"""
+        super().__init__(
+            '{0} is not set: pass {1}=, set the {2} environment variable or '
+            'fill in "{0}" in settings.ini'.format(setting, argument,
+                                                   variable))
+        self.setting = setting
+
+
+class CircuitOpenError(TautulliError):
+    """Request refused while the server's circuit breaker is open"""
+
+    def __init__(self, host, retry_in):
+        """CircuitOpenError constructor"""
+        super().__init__('{0}: circuit open, retry in {1:.1f}s'.format(
+            host, retry_in))
+        self.host = host
+        self.retry_in = retry_in
+
+
+class CommandError(TautulliError):
+    """API command answered with "result": "error" """
+
+    def __init__(self, cmd, message):
+        """CommandError constructor"""
+        super().__init__('{0}: {1}'.format(cmd, message))
+        self.cmd = cmd
+        self.message = message
@@ -0,0 +1,134 @@
+"""
+HistorySync class
+"""
+import json
+import sqlite3
+import time
+
+
+# Row fields stored in their own (indexed) columns
+COLUMNS = ('id', 'date', 'started', 'stopped', 'user_id', 'user',
+           'rating_key', 'media_type', 'duration')
+INDEXED = ('user_id', 'rating_key', 'started', 'media_type')
+
+
+class HistorySync:
+    """Incremental mirror of Tautulli history in a local SQLite database"""
+
+    def __init__(self, tautulli, path, page_size=1000, workers=1,
+                 overlap=86400):
+        """HistorySync constructor"""
+        self.tautulli = tautulli
+        self.page_size = page_size
+        self.workers = workers
+        # Seconds re-read before the high-water mark, catches plays that
+        # started earlier but were written to history later
+        self.overlap = overlap
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        self.conn.row_factory = sqlite3.Row
+        self._create()
+
+    def _create(self):
+        with self.conn:
+            self.conn.execute(
+                'CREATE TABLE IF NOT EXISTS history ({}, row TEXT)'.format(
+                    ', '.join(c + (' INTEGER PRIMARY KEY' if c == 'id'
+                                   else '') for c in COLUMNS)))
+            for column in INDEXED:
+                self.conn.execute(
+                    'CREATE INDEX IF NOT EXISTS history_{0} '
+                    'ON history ({0})'.format(column))
+            self.conn.execute('CREATE TABLE IF NOT EXISTS sync '
+                              '(key TEXT PRIMARY KEY, value)')
+
+    @staticmethod
+    def _keys(filters):
+        """Return the sync table keys of a filter set's high-water mark"""
+        filters = {key: value for key, value in filters.items()
+                   if value is not None}
+        if not filters:
+            return 'id', 'started', 'synced'
+        scope = json.dumps(filters, sort_keys=True, default=str)
+        return tuple('{0} {1}'.format(key, scope)
+                     for key in ('id', 'started', 'synced'))
+
+    def high_water_mark(self, **filters):
+        """Return the (id, started) of the newest row synced by filters"""
+        id_key, started_key, _ = self._keys(filters)
+        values = dict(self.conn.execute(
+            'SELECT key, value FROM sync WHERE key IN (?, ?)',
+            (id_key, started_key)))
+        return values.get(id_key, 0), values.get(started_key, 0)
+
+    def sync(self, **filters):
+        """
+        Fetch rows newer than the high-water mark into the mirror.
+
+        Pages through get_history newest first and stops once rows are
+        older than the high-water mark (minus `overlap`). Every filter
+        set keeps its own high-water mark, so a filtered sync does not
+        hide older rows from an unfiltered one or another filter set.
+
+        Optional parameters:
+            **filters:              Any get_history() filter
+
+        Returns:
+            int: number of new rows
+        """
+        last_id, last_started = self.high_water_mark(**filters)
+        stop_before = last_started - self.overlap if last_id else None
+        rows = self.tautulli.paginate(
+            'get_history', page_size=self.page_size, workers=self.workers,
+            grouping=0, order_column='started', order_dir='desc', **filters)
+        batch = []
+        new = 0
+        max_id, max_started = last_id, last_started
+        try:
+            for row in rows:
+                if stop_before is not None and \
+                        (row.get('started') or 0) < stop_before:
+                    break
+                if row.get('id') is None:
+                    continue
+                if row['id'] > last_id:
+                    new += 1
+                max_id = max(max_id, row['id'])
+                max_started = max(max_started, row.get('started') or 0)
+                batch.append(row)
+                if len(batch) >= self.page_size:
+                    self._insert(batch)
+                    batch = []
+        finally:
+            rows.close()
+        self._insert(batch)
+        with self.conn:
+            self.conn.executemany(
+                'INSERT OR REPLACE INTO sync (key, value) VALUES (?, ?)',
+                zip(self._keys(filters),
+                    (max_id, max_started, int(time.time()))))
+        return new
+
+    def _insert(self, rows):
+        """Upsert history rows"""
+        if not rows:
+            return
+        with self.conn:
+            self.conn.executemany(
+                'INSERT OR REPLACE INTO history ({}, row) VALUES ({}?)'.format(
+                    ', '.join(COLUMNS), '?, ' * len(COLUMNS)),
+                [tuple(row.get(c) for c in COLUMNS) + (json.dumps(row),)
+                 for row in rows])
+
+    def query(self, sql, *params):
+        """Run a read query against the mirror, returns sqlite3.Row list"""
+        return self.conn.execute(sql, params).fetchall()
+
+    def rows(self, where='1', *params):
+        """Return mirrored history rows (dict) matching a WHERE clause"""
+        return [json.loads(r['row']) for r in self.query(
+            'SELECT row FROM history WHERE {} ORDER BY started DESC'.format(
+                where), *params)]
+
+    def close(self):
+        """Close the SQLite connection"""
+        self.conn.close()
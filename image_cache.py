@@ -0,0 +1,145 @@
+"""
+ImageCache class
+"""
+import hashlib
+import json
+import os
+import threading
+import time
+from exceptions import TautulliError
+
+
+# pms_image_proxy parameters that identify a rendered image
+IMAGE_KEYS = ('rating_key', 'width', 'height', 'opacity', 'background',
+              'blur', 'img_format', 'fallback')
+
+
+class ImageCache:
+    """Size-bounded, content-addressed on-disk image cache"""
+
+    def __init__(self, directory, max_bytes=256 * 1024 * 1024,
+                 max_age=86400):
+        """ImageCache constructor"""
+        self.directory = directory
+        # Least recently used images are evicted past this size
+        self.max_bytes = max_bytes
+        # Seconds an image is served without revalidating it with PMS
+        self.max_age = max_age
+        self._lock = threading.Lock()
+        os.makedirs(directory, exist_ok=True)
+        # Bytes of cached images, counted once here and kept up to date so
+        # the directory is only scanned when over `max_bytes`
+        self.size = sum(size for _, size, _ in self._images())
+
+    @staticmethod
+    def key(params):
+        """Return the cache key of pms_image_proxy parameters"""
+        ident = json.dumps([[k, params.get(k)] for k in IMAGE_KEYS])
+        return hashlib.sha256(ident.encode('utf-8')).hexdigest()
+
+    def _path(self, key, ext=''):
+        return os.path.join(self.directory, key + ext)
+
+    def fetch(self, params, requester):
+        """
+        Return image bytes from disk, revalidating or requesting as needed.
+
+        Expired images are revalidated with If-None-Match/If-Modified-Since
+        so an unchanged image is not transferred again. Only image/*
+        responses are cached, e.g. JSON errors are returned as they are.
+        """
+        key = self.key(params)
+        path = self._path(key)
+        meta = self._read_meta(key)
+        headers = {}
+        if meta is not None and os.path.exists(path):
+            if time.time() - meta['fetched'] < self.max_age:
+                return self._read(path)
+            if meta.get('etag'):
+                headers['If-None-Match'] = meta['etag']
+            if meta.get('last_modified'):
+                headers['If-Modified-Since'] = meta['last_modified']
+        r = requester.raw(headers=headers)
+        if r.status_code == 304:
+            if not headers:
+                raise TautulliError('pms_image_proxy: 304 Not Modified '
+                                    'without a conditional request')
+            meta['fetched'] = time.time()
+            self._write_meta(key, meta)
+            return self._read(path)
+        content = r.content
+        content_type = r.headers.get('Content-Type') or ''
+        if not content_type.startswith('image/'):
+            return content
+        try:
+            replaced = os.path.getsize(path)
+        except OSError:
+            replaced = 0
+        self._write(path, content)
+        with self._lock:
+            self.size += len(content) - replaced
+        self._write_meta(key, {'etag': r.headers.get('ETag'),
+                               'last_modified': r.headers.get('Last-Modified'),
+                               'fetched': time.time()})
+        if self.size > self.max_bytes:
+            self.evict()
+        return content
+
+    def _images(self):
+        """Return (mtime, size, name) of every cached image"""
+        images = []
+        for entry in os.scandir(self.directory):
+            if entry.is_file() and '.' not in entry.name:
+                stat = entry.stat()
+                images.append((stat.st_mtime, stat.st_size, entry.name))
+        return images
+
+    def evict(self):
+        """Remove least recently used images until under `max_bytes`"""
+        with self._lock:
+            images = self._images()
+            total = sum(size for _, size, _ in images)
+            for _, size, name in sorted(images):
+                if total <= self.max_bytes:
+                    break
+                for ext in ('', '.json'):
+                    try:
+                        os.remove(self._path(name, ext))
+                    except FileNotFoundError:
+                        pass
+                total -= size
+            self.size = total
+
+    def clear(self):
+        """Remove every cached image"""
+        with self._lock:
+            for entry in os.scandir(self.directory):
+                if entry.is_file():
+                    os.remove(entry.path)
+            self.size = 0
+
+    @staticmethod
+    def _read(path):
+        with open(path, 'rb') as f:
+            content = f.read()
+        # Mark as recently used for eviction
+        os.utime(path)
+        return content
+
+    @staticmethod
+    def _write(path, content):
+        tmp = '{}.{}.tmp'.format(path, threading.get_ident())
+        with open(tmp, 'wb') as f:
+            f.write(content)
+        os.replace(tmp, path)
+
+    def _read_meta(self, key):
+        try:
+            with open(self._path(key, '.json'), 'r') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def _write_meta(self, key, meta):
+        self._write(self._path(key, '.json'),
+                    json.dumps(meta).encode('utf-8'))
@@ -0,0 +1,41 @@
+"""
+Deferred imports
+"""
+import importlib
+import threading
+
+
+# Module name -> imported module, None if it is not installed
+_modules = {}
+_lock = threading.Lock()
+
+
+def optional(name):
+    """
+    Import an optional dependency on first use.
+
+    Keeps `import tautulli` fast: numpy, aiohttp, orjson, ... are only
+    loaded by the first feature that needs them.
+
+    Required parameters:
+        name (str):     The module name, e.g. "numpy"
+
+    Returns:
+        The module, or None if it is not installed
+
+    Example usage:
+        numpy = optional('numpy')
+        if numpy is not None:
+            ...
+    """
+    try:
+        return _modules[name]
+    except KeyError:
+        pass
+    with _lock:
+        if name not in _modules:
+            try:
+                _modules[name] = importlib.import_module(name)
+            except ImportError:
+                _modules[name] = None
+        return _modules[name]
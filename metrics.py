@@ -0,0 +1,164 @@
+"""
+Request metrics registry
+"""
+import threading
+from collections import defaultdict
+
+
+# Histogram upper bounds
+SECONDS_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+BYTES_BUCKETS = (1024, 10240, 102400, 1048576, 10485760, 104857600)
+
+
+class Histogram:
+    """Cumulative bucket histogram"""
+
+    def __init__(self, buckets):
+        """Histogram constructor"""
+        self.buckets = buckets
+        # One count per bucket plus +Inf
+        self.counts = [0] * (len(buckets) + 1)
+        self.sum = 0
+        self.count = 0
+
+    def observe(self, value):
+        """Add a value"""
+        for i, bound in enumerate(self.buckets):
+            if value <= bound:
+                break
+        else:
+            i = len(self.buckets)
+        self.counts[i] += 1
+        self.sum += value
+        self.count += 1
+
+    def cumulative(self):
+        """Yield (upper bound, cumulative count) pairs, the last is +Inf"""
+        total = 0
+        for bound, count in zip(self.buckets + ('+Inf',), self.counts):
+            total += count
+            yield bound, total
+
+    def to_dict(self):
+        """Return count, sum and cumulative bucket counts"""
+        return {'count': self.count, 'sum': self.sum,
+                'buckets': dict(self.cumulative())}
+
+
+class Metrics:
+    """Per-command latency, response size, status and retry metrics"""
+
+    def __init__(self):
+        """Metrics constructor"""
+        # (cmd, phase) -> Histogram of seconds
+        self.seconds = {}
+        # cmd -> Histogram of response bytes
+        self.bytes = {}
+        # (cmd, status) -> count
+        self.responses = defaultdict(int)
+        # cmd -> count
+        self.retries = defaultdict(int)
+        self._lock = threading.Lock()
+
+    def record(self, cmd, status, seconds, size=None, retries=0):
+        """
+        Record one request.
+
+        Required parameters:
+            cmd (str):              The API command
+            status (int/str):       HTTP status or exception class name
+            seconds (dict):         Phase durations: "total", "ttfb"
+                                    (includes DNS/connect on a new
+                                    connection), "transfer", "decode"
+
+        Optional parameters:
+            size (int):             Response body bytes
+            retries (int):          Number of retries sent
+        """
+        with self._lock:
+            for phase, value in seconds.items():
+                key = (cmd, phase)
+                if key not in self.seconds:
+                    self.seconds[key] = Histogram(SECONDS_BUCKETS)
+                self.seconds[key].observe(value)
+            if size is not None:
+                if cmd not in self.bytes:
+                    self.bytes[cmd] = Histogram(BYTES_BUCKETS)
+                self.bytes[cmd].observe(size)
+            self.responses[(cmd, str(status))] += 1
+            if retries:
+                self.retries[cmd] += retries
+
+    def to_dict(self):
+        """Return every metric grouped by command"""
+        with self._lock:
+            commands = defaultdict(lambda: {'seconds': {}, 'bytes': None,
+                                            'responses': {}, 'retries': 0})
+            for (cmd, phase), hist in self.seconds.items():
+                commands[cmd]['seconds'][phase] = hist.to_dict()
+            for cmd, hist in self.bytes.items():
+                commands[cmd]['bytes'] = hist.to_dict()
+            for (cmd, status), count in self.responses.items():
+                commands[cmd]['responses'][status] = count
+            for cmd, count in self.retries.items():
+                commands[cmd]['retries'] = count
+            return dict(commands)
+
+    def to_prometheus(self, prefix='tautulli'):
+        """Return every metric in the Prometheus text exposition format"""
+        lines = []
+        with self._lock:
+            lines += _histogram(
+                prefix + '_request_seconds',
+                'API request duration by phase',
+                [({'cmd': cmd, 'phase': phase}, hist)
+                 for (cmd, phase), hist in sorted(self.seconds.items())])
+            lines += _histogram(
+                prefix + '_response_bytes', 'API response body size',
+                [({'cmd': cmd}, hist)
+                 for cmd, hist in sorted(self.bytes.items())])
+            lines += ['# HELP {}_responses_total API responses by status'
+                      .format(prefix),
+                      '# TYPE {}_responses_total counter'.format(prefix)]
+            lines += ['{}_responses_total{} {}'.format(
+                prefix, _labels({'cmd': cmd, 'status': status}), count)
+                for (cmd, status), count in sorted(self.responses.items())]
+            lines += ['# HELP {}_retries_total API request retries'
+                      .format(prefix),
+                      '# TYPE {}_retries_total counter'.format(prefix)]
+            lines += ['{}_retries_total{} {}'.format(
+                prefix, _labels({'cmd': cmd}), count)
+                for cmd, count in sorted(self.retries.items())]
+        return '\n'.join(lines) + '\n'
+
+    def clear(self):
+        """Reset every metric"""
+        with self._lock:
+            self.seconds.clear()
+            self.bytes.clear()
+            self.responses.clear()
+            self.retries.clear()
+
+
+def _labels(labels):
+    return '{' + ','.join('{}="{}"'.format(k, _escape(v))
+                          for k, v in labels.items()) + '}'
+
+
+def _escape(value):
+    # Label values escape backslash, double quote and line feed
+    return (str(value).replace('\\', '\\\\').replace('"', '\\"')
+            .replace('\n', '\\n'))
+
+
+def _histogram(name, help_text, series):
+    lines = ['# HELP {} {}'.format(name, help_text),
+             '# TYPE {} histogram'.format(name)]
+    for labels, hist in series:
+        for bound, count in hist.cumulative():
+            lines.append('{}_bucket{} {}'.format(
+                name, _labels(dict(labels, le=bound)), count))
+        lines.append('{}_sum{} {}'.format(name, _labels(labels), hist.sum))
+        lines.append('{}_count{} {}'.format(name, _labels(labels),
+                                            hist.count))
+    return lines
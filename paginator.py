@@ -0,0 +1,164 @@
+"""
+Paginator class
+"""
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from records import RECORDS
+
+
+# Table commands paged by start/end row numbers instead of start/length
+LINE_PAGED = ('get_logs',)
+# Row keys used to drop duplicates, first match wins
+ROW_ID_KEYS = ('id', 'rating_key')
+
+
+class Paginator:
+    """DataTables-style table paging class"""
+
+    def __init__(self, tautulli, cmd, page_size=100, workers=1, **params):
+        """Paginator constructor"""
+        # Pages are read as row lists, not column arrays or JSON text
+        for name in ('as_columns', 'pprint'):
+            if params.get(name):
+                raise ValueError('{0}() does not support {1}=True, pages '
+                                 'are yielded as rows'.format(
+                                     type(self).__name__, name))
+        if params.get('as_records') and cmd not in RECORDS:
+            raise ValueError('as_records=True is not supported by {0}, '
+                             'only by {1}'.format(cmd, ', '.join(RECORDS)))
+        self.cmd = cmd
+        self.method = getattr(tautulli, cmd)
+        self.page_size = page_size
+        # Number of pages requested concurrently
+        self.workers = max(1, workers)
+        self.params = params
+        self.line_paged = cmd in LINE_PAGED
+
+    def __iter__(self):
+        """Yield table rows in order"""
+        for rows in self.pages():
+            for row in rows:
+                yield row
+
+    def _range(self, start):
+        """Request parameters of the page starting at row `start`"""
+        if self.line_paged:
+            return dict(self.params, start=start, end=start + self.page_size)
+        return dict(self.params, start=start, length=self.page_size)
+
+    def _rows(self, r):
+        """Return (rows, recordsFiltered) of a page response"""
+        data = r['response']['data']
+        if self.line_paged:
+            return data, None
+        return data['data'], data.get('recordsFiltered')
+
+    def _page(self, start):
+        """Request a single page, returns (rows, recordsFiltered)"""
+        return self._rows(self.method(**self._range(start)))
+
+    def pages(self):
+        """
+        Yield each page of rows in order.
+
+        Until "recordsFiltered" is known one page is prefetched at a time,
+        afterwards up to `workers` pages are kept in flight.
+        """
+        executor = ThreadPoolExecutor(max_workers=self.workers)
+        try:
+            pending = deque([executor.submit(self._page, 0)])
+            start = self.page_size
+            total = None
+            while pending:
+                rows, filtered = pending.popleft().result()
+                if filtered is not None:
+                    total = filtered
+                if total is None:
+                    # Unknown table size, continue while pages come back full
+                    if len(rows) >= self.page_size:
+                        pending.append(executor.submit(self._page, start))
+                        start += self.page_size
+                else:
+                    while start < total and len(pending) < self.workers:
+                        pending.append(executor.submit(self._page, start))
+                        start += self.page_size
+                yield rows
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def fetch_all(self):
+        """
+        Return every row as a list.
+
+        Rows seen twice (table shifted between concurrent page requests)
+        are dropped by their "id" or "rating_key".
+        """
+        return list(unique(self))
+
+
+def unique(rows):
+    """Yield rows, dropping repeated "id" or "rating_key" values"""
+    seen = set()
+    for row in rows:
+        key = next(((k, row[k]) for k in ROW_ID_KEYS
+                    if row.get(k) is not None), None)
+        if key is not None:
+            if key in seen:
+                continue
+            seen.add(key)
+        yield row
+
+
+class AsyncPaginator(Paginator):
+    """DataTables-style table paging class of AsyncTautulli"""
+
+    def __iter__(self):
+        raise TypeError("use 'async for' with AsyncTautulli")
+
+    async def __aiter__(self):
+        """Yield table rows in order"""
+        async for rows in self.pages():
+            for row in rows:
+                yield row
+
+    async def _page(self, start):
+        """Request a single page, returns (rows, recordsFiltered)"""
+        return self._rows(await self.method(**self._range(start)))
+
+    async def pages(self):
+        """
+        Yield each page of rows in order.
+
+        Same prefetching as Paginator.pages(), with tasks instead of
+        threads.
+        """
+        import asyncio
+        pending = deque([asyncio.ensure_future(self._page(0))])
+        try:
+            start = self.page_size
+            total = None
+            while pending:
+                rows, filtered = await pending.popleft()
+                if filtered is not None:
+                    total = filtered
+                if total is None:
+                    if len(rows) >= self.page_size:
+                        pending.append(
+                            asyncio.ensure_future(self._page(start)))
+                        start += self.page_size
+                else:
+                    while start < total and len(pending) < self.workers:
+                        pending.append(
+                            asyncio.ensure_future(self._page(start)))
+                        start += self.page_size
+                yield rows
+        finally:
+            for task in pending:
+                task.cancel()
+
+    async def fetch_all(self):
+        """Return every row as a list, see Paginator.fetch_all()"""
+        rows = []
+        async for row in self:
+            rows.append(row)
+        return list(unique(rows))
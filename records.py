@@ -0,0 +1,202 @@
+"""
+Response record classes
+
+Compact alternatives to the row dicts of the largest responses: the
+commonly used fields of a row are __slots__ attributes, all other fields
+stay in one tuple whose key names are shared by every row of the same
+shape, and are only turned into a dict on request (to_dict()).
+"""
+
+
+# Source of a _Shape builder, `share` deduplicates equal strings
+BUILDER = '''def build(row, share):
+    record = new(cls)
+{hot}
+    record._shape = shape
+    record._rare = ({rare})
+    return record
+'''
+# Expression reading one field of `row`
+VALUE = "(share(v, v) if (v := row[{0!r}]).__class__ is str else v)"
+
+
+class _Shape:
+    """Field layout shared by the records of rows with the same keys"""
+
+    __slots__ = ('hot', 'rare', 'index', 'build')
+
+    def __init__(self, cls, keys):
+        """_Shape constructor"""
+        slots = frozenset(cls.__slots__)
+        # Slot fields present in the rows
+        self.hot = tuple(key for key in keys if key in slots)
+        # Remaining fields, in row order
+        self.rare = tuple(key for key in keys if key not in slots)
+        self.index = {key: i for i, key in enumerate(self.rare)}
+        # build(row, share) -> record, compiled once per shape
+        hot = ['    record.{0} = {1}'.format(key, VALUE.format(key))
+               for key in self.hot]
+        rare = [VALUE.format(key) + ', ' for key in self.rare]
+        source = BUILDER.format(hot='\n'.join(hot), rare=''.join(rare))
+        namespace = {'new': cls.__new__, 'cls': cls, 'shape': self}
+        exec(compile(source, '<record {}>'.format(cls.__name__), 'exec'),
+             namespace)
+        self.build = namespace['build']
+
+
+# (record class, row keys) -> _Shape
+_shapes = {}
+
+
+class Record:
+    """
+    Base record class
+
+    Fields read as attributes (record.user_id) or items (record["user_id"],
+    record.get("user_id")), for every field of the row.
+    """
+
+    __slots__ = ('_shape', '_rare')
+
+    @classmethod
+    def from_dict(cls, row, share=None):
+        """
+        Return the record of a row dict.
+
+        Equal string values are stored once per `share` dict, pass the
+        same dict for many rows (see from_rows()).
+        """
+        keys = tuple(row)
+        try:
+            shape = _shapes[cls, keys]
+        except KeyError:
+            shape = _shapes.setdefault((cls, keys), _Shape(cls, keys))
+        return shape.build(row, ({} if share is None else share).setdefault)
+
+    @classmethod
+    def from_rows(cls, rows):
+        """Return the records of a list of row dicts"""
+        share = {}
+        return [cls.from_dict(row, share) for row in rows]
+
+    def __getattr__(self, name):
+        # Only called for rare fields and missing slot fields
+        if not name.startswith('_'):
+            i = self._shape.index.get(name)
+            if i is not None:
+                return self._rare[i]
+        raise AttributeError("'{0}' record has no field '{1}'".format(
+            type(self).__name__, name))
+
+    def __getitem__(self, key):
+        try:
+            return getattr(self, key)
+        except AttributeError:
+            raise KeyError(key) from None
+
+    def __contains__(self, key):
+        return key in self._shape.index or key in self._shape.hot
+
+    def __reduce__(self):
+        # The shape holds compiled code, pickle the row instead
+        return type(self).from_dict, (self.to_dict(),)
+
+    def __eq__(self, other):
+        if not isinstance(other, Record):
+            return NotImplemented
+        return self.to_dict() == other.to_dict()
+
+    def __repr__(self):
+        return '{0}({1})'.format(type(self).__name__, ', '.join(
+            '{0}={1!r}'.format(key, getattr(self, key))
+            for key in self._shape.hot))
+
+    def get(self, key, default=None):
+        """Return a field, or `default` if the row does not have it"""
+        try:
+            return getattr(self, key)
+        except AttributeError:
+            return default
+
+    def keys(self):
+        """Return the field names, slot fields first"""
+        return self._shape.hot + self._shape.rare
+
+    def to_dict(self):
+        """Return the row as a dict"""
+        row = {key: getattr(self, key) for key in self._shape.hot}
+        row.update(zip(self._shape.rare, self._rare))
+        return row
+
+
+class HistoryRow(Record):
+    """get_history row"""
+
+    __slots__ = ('id', 'reference_id', 'date', 'started', 'stopped',
+                 'duration', 'paused_counter', 'user_id', 'user',
+                 'friendly_name', 'rating_key', 'parent_rating_key',
+                 'grandparent_rating_key', 'full_title', 'title',
+                 'media_type', 'platform', 'player', 'ip_address',
+                 'transcode_decision', 'percent_complete',
+                 'watched_status')
+
+
+class ActivitySession(Record):
+    """get_activity session"""
+
+    __slots__ = ('session_key', 'session_id', 'state', 'user_id', 'user',
+                 'friendly_name', 'rating_key', 'full_title', 'title',
+                 'media_type', 'player', 'platform', 'product',
+                 'ip_address', 'location', 'bandwidth', 'progress_percent',
+                 'view_offset', 'duration', 'quality_profile',
+                 'transcode_decision', 'video_decision', 'audio_decision',
+                 'subtitle_decision', 'stream_video_resolution',
+                 'stream_bitrate', 'transcode_hw_encoding')
+
+
+class StreamData(Record):
+    """get_stream_data response"""
+
+    __slots__ = ('title', 'media_type', 'container', 'bitrate',
+                 'video_codec', 'video_resolution', 'audio_codec',
+                 'audio_channels', 'quality_profile', 'stream_container',
+                 'stream_bitrate', 'stream_video_codec',
+                 'stream_video_resolution', 'stream_audio_codec',
+                 'video_decision', 'audio_decision')
+
+
+class MediaInfoRow(Record):
+    """get_library_media_info row"""
+
+    __slots__ = ('rating_key', 'section_id', 'media_type', 'title',
+                 'year', 'added_at', 'last_played', 'play_count',
+                 'file_size', 'bitrate', 'container', 'video_codec',
+                 'video_resolution', 'audio_codec')
+
+
+# Command -> (record class, data key holding the rows, None: data itself)
+RECORDS = {'get_history': (HistoryRow, 'data'),
+           'get_activity': (ActivitySession, 'sessions'),
+           'get_stream_data': (StreamData, None),
+           'get_library_media_info': (MediaInfoRow, 'data')}
+
+
+def to_records(cmd, r):
+    """
+    Return an API response with its rows as record objects.
+
+    The response itself is not modified. Commands without a record class
+    raise ValueError.
+    """
+    try:
+        cls, key = RECORDS[cmd]
+    except KeyError:
+        raise ValueError('as_records=True is not supported by {0}, only '
+                         'by {1}'.format(cmd, ', '.join(RECORDS))) from None
+    data = r['response']['data']
+    if key is None:
+        if isinstance(data, dict):
+            data = cls.from_dict(data)
+    elif isinstance(data, dict) and isinstance(data.get(key), list):
+        data = dict(data, **{key: cls.from_rows(data[key])})
+    return {'response': dict(r['response'], data=data)}
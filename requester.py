@@ -1,27 +1,407 @@
 """
 Requester class
 """
-import requests
+from lazy import optional
+from resilience import is_idempotent
 import json
+import os
+import time
+from functools import partial
+
+
+# Keys of the response envelope and the DataTables wrapper, objects
+# holding one are never projected
+ENVELOPE_KEYS = frozenset(('response', 'result', 'draw', 'recordsTotal',
+                           'recordsFiltered'))
+
+
+def default_decoder():
+    """Return the fastest installed JSON decoder"""
+    # orjson parses response bytes without a str copy
+    orjson = optional('orjson')
+    return orjson.loads if orjson is not None else json.loads
+
+
+def projecting_decoder(fields, decoder=None):
+    """
+    Return a JSON decoder keeping only `fields` of the table rows.
+
+    With the standard library decoder, rows are trimmed while the
+    response is decoded through an object_hook: peak memory scales with
+    the kept fields, but decoding is slower than a full decode. Other
+    decoders (orjson by default) have no per-object hook and decode
+    everything faster than the hook can trim, so their rows are trimmed
+    right after decoding instead.
+    """
+    fields = tuple(fields)
+    decoder = decoder or default_decoder()
+    if decoder is json.loads:
+        def project(obj):
+            if ENVELOPE_KEYS.isdisjoint(obj):
+                return {key: obj[key] for key in fields if key in obj}
+            return obj
+        return partial(json.loads, object_hook=project)
+
+    def decode(body):
+        r = decoder(body)
+        project_rows(r, fields)
+        return r
+    return decode
+
+
+def project_rows(r, fields):
+    """Keep only `fields` of the rows of a decoded table response"""
+    data = r.get('response', {}).get('data') if isinstance(r, dict) else None
+    if isinstance(data, dict):
+        data = data.get('data')
+    if isinstance(data, list):
+        data[:] = [{key: row[key] for key in fields if key in row}
+                   if isinstance(row, dict) else row for row in data]
+
+
+def pretty(r):
+    """Return a decoded response as pretty-printed JSON"""
+    return json.dumps(r, sort_keys=True, indent=4)
+
+
+def new_session(pool_connections=10, pool_maxsize=10, pool_block=False):
+    """Return a keep-alive session with a pooled HTTP(S) adapter"""
+    # Imported here, requests alone roughly doubles `import tautulli`
+    import requests
+    from requests.adapters import HTTPAdapter
+    session = requests.Session()
+    # One adapter per schema so both share the same pool settings
+    adapter = HTTPAdapter(pool_connections=pool_connections,
+                          pool_maxsize=pool_maxsize,
+                          pool_block=pool_block)
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return session
+
+
+def new_async_session(limit=10, limit_per_host=0, keepalive_timeout=15):
+    """Return a keep-alive aiohttp session with a pooled connector"""
+    aiohttp = optional('aiohttp')
+    if aiohttp is None:
+        raise ImportError("AsyncTautulli requires the 'aiohttp' package")
+    connector = aiohttp.TCPConnector(limit=limit,
+                                     limit_per_host=limit_per_host,
+                                     keepalive_timeout=keepalive_timeout)
+    return aiohttp.ClientSession(connector=connector)
 
 
 class Requester:
     """Requester class"""
 
-    def __init__(self, url, payload):
+    def __init__(self, url, payload, session=None, decoder=None,
+                 timeout=None, retry=None, breaker=None, metrics=None):
         """Requester constructor"""
         self.url = url
         self.payload = payload
+        # Shared session, falls back to a one-off connection per request
+        if session is None:
+            import requests
+            session = requests
+        self.session = session
+        # Callable decoding the JSON response body from bytes
+        self.decoder = decoder or default_decoder()
+        # (connect, read) timeout in seconds
+        self.timeout = timeout
+        # RetryPolicy, only applied to idempotent commands
+        self.retry = retry
+        # Host CircuitBreaker
+        self.breaker = breaker
+        # Metrics registry receiving per-request timings
+        self.metrics = metrics
+        self.retries = 0
         # self.auth = auth
 
     def get(self, pprint=False):
         """Send/receive API request"""
-        r = requests.get(self.url, params=self.payload)
+        start = time.perf_counter()
+        try:
+            r = self._send(stream=True)
+        except Exception as e:
+            self._observe(type(e).__name__, start)
+            raise
+        ttfb = time.perf_counter()
+        content = r.content
+        transfer = time.perf_counter()
         if r.status_code == 200:
-            r = json.loads(r.content.decode('utf-8'))
-            if pprint:
-                return json.dumps(r, sort_keys=True, indent=4)
-            else:
-                return r
+            r = self._decode(content, pprint=pprint)
+            self._observe(200, start, ttfb, transfer, len(content))
+            return r
         else:
+            self._observe(r.status_code, start, ttfb, transfer,
+                          len(content))
             r.raise_for_status()
+
+    def _observe(self, status, start, ttfb=None, transfer=None, size=None,
+                 decode=True):
+        """Report request timings, `decode`: the body was decoded"""
+        if self.metrics is None:
+            return
+        end = time.perf_counter()
+        seconds = {'total': end - start}
+        if ttfb is not None:
+            seconds['ttfb'] = ttfb - start
+            seconds['transfer'] = transfer - ttfb
+            if decode and status == 200:
+                seconds['decode'] = end - transfer
+        self.metrics.record(self.payload['cmd'], status, seconds, size=size,
+                            retries=self.retries)
+
+    def raw(self, headers=None):
+        """Send API request, returns the undecoded response"""
+        start = time.perf_counter()
+        try:
+            r = self._send(headers=headers, stream=True)
+        except Exception as e:
+            self._observe(type(e).__name__, start)
+            raise
+        ttfb = time.perf_counter()
+        content = r.content
+        self._observe(r.status_code, start, ttfb, time.perf_counter(),
+                      len(content), decode=False)
+        if r.status_code not in (200, 304):
+            r.raise_for_status()
+        return r
+
+    def _delays(self):
+        """Return the retry delays allowed for this request"""
+        if self.retry is None or not is_idempotent(self.payload['cmd']):
+            return iter(())
+        return self.retry.delays()
+
+    def _retryable(self, status):
+        return self.retry is not None and status in self.retry.statuses
+
+    def _send(self, **kwargs):
+        """Send request with timeout, retries and circuit breaker"""
+        import requests
+        delays = self._delays()
+        while True:
+            if self.breaker is not None:
+                self.breaker.before()
+            try:
+                r = self.session.get(self.url, params=self.payload,
+                                     timeout=self.timeout, **kwargs)
+            except requests.ConnectionError:
+                # Includes ConnectTimeout, never ReadTimeout
+                self._record(False)
+                delay = next(delays, None)
+                if delay is None:
+                    raise
+            except BaseException:
+                # A slow server is not a failing one, and the command may
+                # still be running: neither retried nor counted
+                self._record(None)
+                raise
+            else:
+                self._record(r.status_code < 500)
+                if r.status_code < 500 or not self._retryable(r.status_code):
+                    return r
+                delay = next(delays, None)
+                if delay is None:
+                    return r
+                r.close()
+            self.retries += 1
+            time.sleep(delay)
+
+    def _record(self, ok):
+        """Report a request outcome to the circuit breaker, None: none"""
+        if self.breaker is not None:
+            if ok is None:
+                self.breaker.release()
+            elif ok:
+                self.breaker.success()
+            else:
+                self.breaker.failure()
+
+    def download(self, dest, chunk_size=1024 * 1024, progress=None,
+                 resume=False):
+        """
+        Stream the response body to `dest` in constant memory.
+
+        `dest` is a file path or a writable binary file-like object. With
+        `resume`, an existing partial file is continued with an HTTP Range
+        request. `progress(written, total)` is called after every chunk,
+        `total` is None if the server sends no Content-Length.
+
+        Returns the size of the downloaded file in bytes.
+        """
+        offset, headers = self._range(dest, resume)
+        start = time.perf_counter()
+        try:
+            r = self._send(headers=headers, stream=True)
+        except Exception as e:
+            self._observe(type(e).__name__, start)
+            raise
+        ttfb = time.perf_counter()
+        with r:
+            if r.status_code == 416:
+                # Nothing left past the resume offset
+                self._observe(416, start, ttfb, ttfb, 0, decode=False)
+                return offset
+            if r.status_code not in (200, 206):
+                self._observe(r.status_code, start, ttfb, ttfb,
+                              decode=False)
+                r.raise_for_status()
+            if r.status_code == 200:
+                # Range ignored, start over
+                offset = 0
+            total = self._total(r.headers, offset)
+            with _Output(dest, offset) as f:
+                written = offset
+                for chunk in r.iter_content(chunk_size=chunk_size):
+                    f.write(chunk)
+                    written += len(chunk)
+                    if progress:
+                        progress(written, total)
+        self._observe(r.status_code, start, ttfb, time.perf_counter(),
+                      written - offset, decode=False)
+        return written
+
+    @staticmethod
+    def _range(dest, resume):
+        """Return the resume offset and request headers for a download"""
+        if not resume:
+            return 0, {}
+        if not isinstance(dest, (str, os.PathLike)):
+            raise ValueError('resume=True needs a file path dest, the '
+                             'size of a file object is unknown')
+        if os.path.exists(dest):
+            offset = os.path.getsize(dest)
+            return offset, {'Range': 'bytes={}-'.format(offset)}
+        return 0, {}
+
+    @staticmethod
+    def _total(headers, offset):
+        """Return the full download size from Content-Length, if known"""
+        length = headers.get('Content-Length')
+        return int(length) + offset if length is not None else None
+
+    def _decode(self, content, pprint=False):
+        """Decode response body"""
+        r = self.decoder(content)
+        if pprint:
+            return pretty(r)
+        else:
+            return r
+
+
+class AsyncRequester(Requester):
+    """Asyncio requester class"""
+
+    async def get(self, pprint=False):
+        """Send/receive API request without blocking the event loop"""
+        start = time.perf_counter()
+        try:
+            r = await self._send()
+        except Exception as e:
+            self._observe(type(e).__name__, start)
+            raise
+        ttfb = time.perf_counter()
+        async with r:
+            content = await r.read()
+            transfer = time.perf_counter()
+            if r.status == 200:
+                decoded = self._decode(content, pprint=pprint)
+                self._observe(200, start, ttfb, transfer, len(content))
+                return decoded
+            else:
+                self._observe(r.status, start, ttfb, transfer, len(content))
+                r.raise_for_status()
+
+    async def _send(self, **kwargs):
+        """Send request with timeout, retries and circuit breaker"""
+        import asyncio
+        # aiohttp only accepts str/int/float query values
+        params = {key: str(val) for key, val in self.payload.items()}
+        aiohttp = optional('aiohttp')
+        if self.timeout is not None:
+            connect, read = self.timeout if isinstance(
+                self.timeout, tuple) else (self.timeout, self.timeout)
+            kwargs['timeout'] = aiohttp.ClientTimeout(sock_connect=connect,
+                                                      sock_read=read)
+        # Connection refused/unreachable and connect timeouts (aiohttp 3.10+)
+        connect_errors = (aiohttp.ClientConnectorError,) + tuple(
+            getattr(aiohttp, name) for name in ('ConnectionTimeoutError',)
+            if hasattr(aiohttp, name))
+        delays = self._delays()
+        while True:
+            if self.breaker is not None:
+                self.breaker.before()
+            try:
+                r = await self.session.get(self.url, params=params,
+                                           **kwargs)
+            except connect_errors:
+                self._record(False)
+                delay = next(delays, None)
+                if delay is None:
+                    raise
+            except BaseException:
+                # Read timeouts, cancellation: neither retried nor counted
+                self._record(None)
+                raise
+            else:
+                self._record(r.status < 500)
+                if r.status < 500 or not self._retryable(r.status):
+                    return r
+                delay = next(delays, None)
+                if delay is None:
+                    return r
+                r.release()
+            self.retries += 1
+            await asyncio.sleep(delay)
+
+    async def download(self, dest, chunk_size=1024 * 1024, progress=None,
+                       resume=False):
+        """Stream the response body to `dest` without blocking on the socket"""
+        offset, headers = self._range(dest, resume)
+        start = time.perf_counter()
+        try:
+            r = await self._send(headers=headers)
+        except Exception as e:
+            self._observe(type(e).__name__, start)
+            raise
+        ttfb = time.perf_counter()
+        async with r:
+            if r.status == 416:
+                self._observe(416, start, ttfb, ttfb, 0, decode=False)
+                return offset
+            if r.status not in (200, 206):
+                self._observe(r.status, start, ttfb, ttfb, decode=False)
+                r.raise_for_status()
+            if r.status == 200:
+                offset = 0
+            total = self._total(r.headers, offset)
+            with _Output(dest, offset) as f:
+                written = offset
+                async for chunk in r.content.iter_chunked(chunk_size):
+                    f.write(chunk)
+                    written += len(chunk)
+                    if progress:
+                        progress(written, total)
+        self._observe(r.status, start, ttfb, time.perf_counter(),
+                      written - offset, decode=False)
+        return written
+
+
+class _Output:
+    """Download target, opens paths and leaves file objects open"""
+
+    def __init__(self, dest, offset):
+        self.dest = dest
+        self.offset = offset
+        self.file = None
+
+    def __enter__(self):
+        if isinstance(self.dest, (str, os.PathLike)):
+            self.file = open(self.dest, 'ab' if self.offset else 'wb')
+            return self.file
+        return self.dest
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if self.file is not None:
+            self.file.close()
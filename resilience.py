@@ -0,0 +1,115 @@
+"""
+Retry and circuit breaker policies
+"""
+import random
+import threading
+import time
+from exceptions import CircuitOpenError
+
+
+# Commands that only read data and are safe to send again
+IDEMPOTENT_PREFIXES = ('get_', 'download_')
+IDEMPOTENT = ('arnold', 'docs', 'docs_md', 'pms_image_proxy', 'search',
+              'update_check')
+
+
+def is_idempotent(cmd):
+    """Return True if an API command can be retried"""
+    return cmd in IDEMPOTENT or cmd.startswith(IDEMPOTENT_PREFIXES)
+
+
+class RetryPolicy:
+    """Jittered exponential backoff for idempotent commands"""
+
+    def __init__(self, retries=3, backoff=0.5, max_backoff=10,
+                 statuses=(502, 503, 504)):
+        """RetryPolicy constructor"""
+        self.retries = retries
+        # First delay in seconds, doubled on every retry
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        # Response statuses worth retrying, connect errors always are.
+        # Read timeouts never are: the server may still be running the
+        # command.
+        self.statuses = statuses
+
+    def delays(self):
+        """Yield the sleep before each retry ("full jitter")"""
+        for attempt in range(self.retries):
+            yield random.uniform(
+                0, min(self.max_backoff, self.backoff * 2 ** attempt))
+
+
+class CircuitBreaker:
+    """Per-host circuit breaker failing fast while a server is down"""
+
+    # host -> CircuitBreaker shared by every client of that host
+    _hosts = {}
+    _hosts_lock = threading.Lock()
+
+    def __init__(self, name, failures=5, reset_timeout=30):
+        """CircuitBreaker constructor"""
+        self.name = name
+        # Consecutive failures that open the circuit
+        self.failures = failures
+        # Seconds before a trial request is let through again
+        self.reset_timeout = reset_timeout
+        self._count = 0
+        self._opened = None
+        # A half-open trial request is waiting for its outcome
+        self._trial_in_flight = False
+        self._lock = threading.Lock()
+
+    @classmethod
+    def for_host(cls, host, **kwargs):
+        """Return the breaker shared by all requests to `host`"""
+        with cls._hosts_lock:
+            if host not in cls._hosts:
+                cls._hosts[host] = cls(host, **kwargs)
+            return cls._hosts[host]
+
+    @property
+    def state(self):
+        """Circuit state: "closed", "open" or "half-open"."""
+        if self._opened is None:
+            return 'closed'
+        if time.monotonic() - self._opened < self.reset_timeout:
+            return 'open'
+        return 'half-open'
+
+    def before(self):
+        """
+        Raise CircuitOpenError unless a request may be sent.
+
+        Once half-open, exactly one trial request is let through, the
+        others are refused until it reports success(), failure() or
+        release().
+        """
+        with self._lock:
+            if self._opened is None:
+                return
+            retry_in = self._opened + self.reset_timeout - time.monotonic()
+            if retry_in > 0 or self._trial_in_flight:
+                raise CircuitOpenError(self.name, max(0, retry_in))
+            self._trial_in_flight = True
+
+    def success(self):
+        """Record a successful request, closing the circuit"""
+        with self._lock:
+            self._count = 0
+            self._opened = None
+            self._trial_in_flight = False
+
+    def failure(self):
+        """Record a failed request, opening the circuit past the limit"""
+        with self._lock:
+            self._count += 1
+            if self._count >= self.failures or self._trial_in_flight:
+                # (Re)open, also after a failed half-open trial
+                self._opened = time.monotonic()
+            self._trial_in_flight = False
+
+    def release(self):
+        """End a request without an outcome, e.g. a read timeout"""
+        with self._lock:
+            self._trial_in_flight = False
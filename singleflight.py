@@ -0,0 +1,70 @@
+"""
+Single-flight request coalescing
+"""
+import threading
+
+
+class _Call:
+    """In-flight call shared by every waiter"""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight:
+    """Coalesces identical concurrent calls (threads) into one"""
+
+    def __init__(self):
+        """SingleFlight constructor"""
+        self._calls = {}
+        self._lock = threading.Lock()
+
+    def do(self, key, fn):
+        """
+        Return `fn()`, sharing one call among concurrent callers of `key`.
+
+        The result is shared between callers and must be treated as
+        read-only.
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+        try:
+            call.result = fn()
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+
+
+class AsyncSingleFlight:
+    """Coalesces identical concurrent calls (asyncio tasks) into one"""
+
+    def __init__(self):
+        """AsyncSingleFlight constructor"""
+        self._futures = {}
+
+    async def do(self, key, fn):
+        """Await `fn()`, sharing one call among concurrent callers of `key`"""
+        # Not imported at module level, only asyncio users pay for it
+        import asyncio
+        future = self._futures.get(key)
+        if future is None:
+            future = self._futures[key] = asyncio.ensure_future(fn())
+            future.add_done_callback(
+                lambda _: self._futures.pop(key, None))
+        # A cancelled waiter must not cancel the shared call
+        return await asyncio.shield(future)
@@ -1,16 +1,52 @@
+from activity import ActivityWatcher
+from aggregate import DAYS, HistoryAggregator
+from array import array
+from async_tautulli import AsyncTautulli
+from benchmarks.mock_server import MockTautulli, history_rows
+from cache import ResponseCache
+from cluster import TautulliCluster
+from columnar import rows_to_columns
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from exceptions import CircuitOpenError, ConfigurationError
+from exceptions import PayloadValidationError, TautulliError
+from history_sync import HistorySync
+from image_cache import ImageCache
+from itertools import islice
+from lazy import optional
+from paginator import unique
+from records import HistoryRow
+from requester import projecting_decoder
+from resilience import CircuitBreaker, RetryPolicy
 from tautulli import Tautulli
+from unittest.mock import Mock, patch
+from validator import SchemaRegistry
+import asyncio
+import io
+import json
+import os
+import pickle
+import requests
+import shutil
+import tempfile
+import time
 import unittest
 
 
-tautulli = Tautulli()
-
-
 class TestTautulli(unittest.TestCase):
     """Test Tautulli() methods"""
 
+    @classmethod
+    def setUpClass(cls):
+        # Needs a Tautulli server configured in the environment/settings.ini
+        try:
+            cls.tautulli = Tautulli()
+        except ConfigurationError as e:
+            raise unittest.SkipTest('no Tautulli server: {}'.format(e))
+
     def test_get_history_0(self):
         """Check default get_history() fn"""
-        req = tautulli.get_history()
+        req = self.tautulli.get_history()
         hist_test_act = req['response']['result']
         self.assertEqual(
             hist_test_act,
@@ -20,7 +56,7 @@ class TestTautulli(unittest.TestCase):
 
     def test_get_history_1(self):
         """Check get_history() fn with kwargs"""
-        req = tautulli.get_history(user='nettles4349', length=10)
+        req = self.tautulli.get_history(user='nettles4349', length=10)
         hist_test_act = req['response']['result']
         self.assertEqual(
             hist_test_act,
@@ -28,14 +64,929 @@ class TestTautulli(unittest.TestCase):
             msg=":::ERROR::: 'test_get_history_1()' FAILED"
         )
 
+    def test_iter_history(self):
+        """Check iter_history() fn pages through get_history()"""
+        req = self.tautulli.get_history(length=10)
+        hist_test_exp = [row['id'] for row in req['response']['data']['data']]
+        hist_test_act = [row['id'] for row in
+                         islice(self.tautulli.iter_history(page_size=3), 10)]
+        self.assertEqual(
+            hist_test_act,
+            hist_test_exp,
+            msg=":::ERROR::: 'test_iter_history()' FAILED"
+        )
+
     def test_get_server_id(self):
         """Check get_server_id() fn"""
-        req = tautulli.get_server_id(hostname='192.168.1.7')
+        req = self.tautulli.get_server_id(hostname='192.168.1.7')
         self.assertIsNotNone(
             req,
             msg=":::ERROR::: 'Tautulli.get_server_id()' returned 'None'"
         )
 
 
+class MockTestCase(unittest.TestCase):
+    """Base class of the tests against the local stand-in server"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.mock = MockTautulli(rows=250, sessions=2, image_bytes=256)
+        cls.mock.start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.mock.stop()
+
+    def setUp(self):
+        self.mock.reset()
+
+    def client(self, **kwargs):
+        """Return a Tautulli() of the stand-in server"""
+        tautulli = Tautulli(host='127.0.0.1', port=self.mock.port,
+                            apikey='test', **kwargs)
+        self.addCleanup(tautulli.close)
+        return tautulli
+
+
+class TestResilience(MockTestCase):
+    """Test timeouts, retries and the circuit breaker"""
+
+    def test_retry_statuses(self):
+        """Check read commands are retried on 503, others are not"""
+        tautulli = self.client(retry=RetryPolicy(retries=3, backoff=0))
+        self.mock.fail.extend([503, 503])
+        req = tautulli.get_activity()
+        self.assertEqual(req['response']['result'], 'success')
+        self.assertEqual(self.mock.requests['get_activity'], 3)
+        self.mock.fail.append(503)
+        with self.assertRaises(requests.HTTPError):
+            tautulli.delete_cache()
+        self.assertEqual(self.mock.requests['delete_cache'], 1)
+
+    def test_retry_read_timeout(self):
+        """Check read timeouts are neither retried nor breaker failures"""
+        breaker = CircuitBreaker('read-timeout', failures=1)
+        tautulli = self.client(timeout=(5, 0.05), breaker=breaker,
+                               retry=RetryPolicy(retries=3, backoff=0))
+        self.mock.delay = 0.2
+        with self.assertRaises(requests.ReadTimeout):
+            tautulli.get_metadata(rating_key=1)
+        self.assertEqual(self.mock.requests['get_metadata'], 1)
+        self.assertEqual(breaker.state, 'closed')
+
+    def test_slow_timeouts(self):
+        """Check slow commands wait past the default read timeout"""
+        tautulli = self.client(timeout=(5, 0.05))
+        self.mock.delay = 0.2
+        req = tautulli.get_library_media_info(section_id=1, refresh=True)
+        self.assertEqual(req['response']['result'], 'success')
+        tautulli = self.client(timeout=(5, 0.05), timeouts={})
+        with self.assertRaises(requests.ReadTimeout):
+            tautulli.get_library_media_info(section_id=1, refresh=True)
+
+    def test_circuit_breaker(self):
+        """Check the breaker opens, half-opens and closes again"""
+        breaker = CircuitBreaker('breaker', failures=2, reset_timeout=0.1)
+        tautulli = self.client(retry=False, breaker=breaker)
+        self.mock.fail.extend([503, 503])
+        for _ in range(2):
+            with self.assertRaises(requests.HTTPError):
+                tautulli.get_activity()
+        self.assertEqual(breaker.state, 'open')
+        with self.assertRaises(CircuitOpenError):
+            tautulli.get_activity()
+        self.assertEqual(self.mock.requests['get_activity'], 2)
+        time.sleep(0.15)
+        self.assertEqual(breaker.state, 'half-open')
+        tautulli.get_activity()
+        self.assertEqual(breaker.state, 'closed')
+
+    def test_circuit_breaker_trial(self):
+        """Check a half-open breaker lets a single trial request through"""
+        breaker = CircuitBreaker('trial', failures=1, reset_timeout=0.05)
+        breaker.failure()
+        time.sleep(0.1)
+        breaker.before()
+        with self.assertRaises(CircuitOpenError):
+            breaker.before()
+        breaker.failure()
+        self.assertEqual(breaker.state, 'open')
+        time.sleep(0.1)
+        breaker.before()
+        breaker.success()
+        breaker.before()
+        breaker.before()
+        self.assertEqual(breaker.state, 'closed')
+
+
+class FakeActivity:
+    """Stand-in Tautulli answering get_activity from a list of polls"""
+
+    def __init__(self, *polls):
+        # Session lists, or exceptions to raise, one per poll
+        self.polls = list(polls)
+
+    def get_activity(self):
+        sessions = self.polls.pop(0)
+        if isinstance(sessions, Exception):
+            raise sessions
+        return {'response': {'result': 'success',
+                             'data': {'sessions': sessions}}}
+
+
+def session(key, state='playing', **fields):
+    """Return a get_activity session"""
+    return dict(fields, session_key=key, state=state)
+
+
+class TestActivityWatcher(unittest.TestCase):
+    """Test ActivityWatcher() diffing and polling"""
+
+    def test_diff(self):
+        """Check every event of a session change is emitted"""
+        watcher = ActivityWatcher(FakeActivity(
+            [session(1), session(2)],
+            [session(1, 'paused'),
+             session(2, transcode_decision='transcode')],
+            [session(1)],
+        ))
+        events = [[(event, s['session_key']) for event, s in watcher.poll()]
+                  for _ in range(3)]
+        self.assertEqual(events, [
+            [('started', 1), ('started', 2)],
+            [('paused', 1), ('transcode_changed', 2)],
+            [('resumed', 1), ('stopped', 2)]])
+
+    def test_callback_error(self):
+        """Check a failing callback loses no events and keeps the interval"""
+        watcher = ActivityWatcher(FakeActivity(
+            [session(1), session(2)], [session(2)]))
+        seen, errors = [], []
+
+        def fail(event, s):
+            raise RuntimeError(s['session_key'])
+        watcher.on('started', fail)
+        watcher.on('started', lambda event, s: seen.append(event))
+        watcher.on('stopped', fail)
+        watcher.on('stopped', lambda event, s: seen.append(event))
+        watcher.on('error', lambda event, e: errors.append(str(e)))
+        watcher.poll()
+        watcher.poll()
+        self.assertEqual(seen, ['started', 'started', 'stopped'])
+        self.assertEqual(errors, ['1', '2', '1'])
+        self.assertEqual(watcher.interval, watcher.active_interval)
+
+    def test_interval(self):
+        """Check the interval doubles while idle, up to idle_interval"""
+        watcher = ActivityWatcher(FakeActivity(
+            [], [], [], [], [session(1)]),
+            active_interval=2, idle_interval=10)
+        intervals = []
+        for _ in range(5):
+            watcher.poll()
+            intervals.append(watcher.interval)
+        self.assertEqual(intervals, [4, 8, 10, 10, 2])
+
+    def test_poll_error(self):
+        """Check a failed get_activity backs off to idle_interval"""
+        watcher = ActivityWatcher(FakeActivity(OSError('down')),
+                                  idle_interval=0)
+        errors = []
+
+        def error(event, e):
+            errors.append(e)
+            watcher.stop()
+        watcher.on('error', error)
+        watcher.run()
+        self.assertEqual(watcher.interval, 0)
+        self.assertIsInstance(errors[0], OSError)
+
+
+class TestResponseCache(MockTestCase):
+    """Test the response cache"""
+
+    def test_cache_ttl(self):
+        """Check cached responses are reused until their TTL passes"""
+        tautulli = self.client(
+            cache=ResponseCache(ttls={'get_libraries': 0.1}))
+        tautulli.get_libraries()
+        tautulli.get_libraries()
+        self.assertEqual(self.mock.requests['get_libraries'], 1)
+        time.sleep(0.15)
+        tautulli.get_libraries()
+        self.assertEqual(self.mock.requests['get_libraries'], 2)
+
+    def test_cache_lru(self):
+        """Check the least recently used response is evicted"""
+        tautulli = self.client(
+            cache=ResponseCache(ttls={'get_library': 60}, maxsize=2))
+        for section_id in (1, 2, 1, 3, 1, 2):
+            tautulli.get_library(section_id=section_id)
+        # 2 was evicted by 3, then requested again
+        self.assertEqual(self.mock.requests['get_library'], 4)
+
+    def test_cache_invalidation(self):
+        """Check mutating commands drop the affected responses"""
+        tautulli = self.client(cache=True)
+        tautulli.get_libraries()
+        tautulli.get_user_names()
+        tautulli.edit_library(section_id=1, keep_history=1)
+        tautulli.get_libraries()
+        tautulli.get_user_names()
+        self.assertEqual(self.mock.requests['get_libraries'], 2)
+        self.assertEqual(self.mock.requests['get_user_names'], 1)
+
+    def test_cache_stale_store(self):
+        """Check reads started before a mutation are not stored"""
+        cache = ResponseCache()
+
+        def read():
+            # edit_library completes while get_libraries is in flight
+            cache.fetch({'cmd': 'edit_library'}, dict)
+            return {'stale': True}
+        self.assertEqual(cache.fetch({'cmd': 'get_libraries'}, read),
+                         {'stale': True})
+        self.assertEqual(cache.fetch({'cmd': 'get_libraries'}, dict), {})
+
+
+class TestSingleFlight(MockTestCase):
+    """Test request coalescing"""
+
+    def test_singleflight(self):
+        """Check concurrent identical reads share one request"""
+        tautulli = self.client(coalesce=True)
+        self.mock.delay = 0.2
+        with ThreadPoolExecutor(max_workers=5) as executor:
+            responses = list(executor.map(
+                lambda _: tautulli.get_activity(), range(5)))
+        self.assertEqual(self.mock.requests['get_activity'], 1)
+        self.assertTrue(all(r is responses[0] for r in responses))
+
+    def test_singleflight_error(self):
+        """Check concurrent callers share the leader's error"""
+        tautulli = self.client(coalesce=True, retry=False)
+        self.mock.delay = 0.2
+        self.mock.fail.append(503)
+
+        def call(_):
+            try:
+                return tautulli.get_activity()
+            except requests.HTTPError as e:
+                return e
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            results = list(executor.map(call, range(3)))
+        self.assertEqual(self.mock.requests['get_activity'], 1)
+        self.assertTrue(all(isinstance(r, requests.HTTPError)
+                            for r in results))
+
+
+class TestPaginator(MockTestCase):
+    """Test table paging"""
+
+    def test_paginator_as_columns(self):
+        """Check paging rejects column arrays"""
+        tautulli = self.client()
+        with self.assertRaises(ValueError):
+            tautulli.paginate('get_history', as_columns=True)
+
+    def test_paginator_unique(self):
+        """Check rows shifted into the next page are dropped"""
+        rows = [{'id': 3}, {'id': 2}, {'id': 2}, {'id': 1},
+                {'rating_key': 7}, {'rating_key': 7}, {'title': 'x'}]
+        self.assertEqual(list(unique(rows)),
+                         [{'id': 3}, {'id': 2}, {'id': 1},
+                          {'rating_key': 7}, {'title': 'x'}])
+
+    def test_paginator_order(self):
+        """Check concurrent pages are yielded in table order"""
+        tautulli = self.client()
+        rows = tautulli.fetch_all('get_history', workers=4, page_size=30)
+        self.assertEqual([row['id'] for row in rows],
+                         [row['id'] for row in self.mock.rows])
+        self.assertEqual(self.mock.requests['get_history'], 9)
+
+
+class TestCluster(MockTestCase):
+    """Test the multi-server client"""
+
+    def test_cluster_merge(self):
+        """Check cluster history is merged in date order and paged"""
+        other = MockTautulli(rows=40).start()
+        self.addCleanup(other.stop)
+        cluster = TautulliCluster({
+            'a': self.client(),
+            'b': {'host': '127.0.0.1', 'port': other.port,
+                  'apikey': 'test'}})
+        self.addCleanup(cluster.close)
+        req = cluster.get_history(length=100)
+        rows = req['response']['data']['data']
+        self.assertEqual(len(rows), 100)
+        dates = [row['date'] for row in rows]
+        self.assertEqual(dates, sorted(dates, reverse=True))
+        self.assertEqual({row['server'] for row in rows}, {'a'})
+        req = cluster.get_history(start=200, length=100)
+        rows = req['response']['data']['data']
+        self.assertEqual(len(rows), 90)
+        self.assertEqual(req['response']['data']['recordsTotal'], 290)
+        self.assertEqual({row['server'] for row in rows}, {'a', 'b'})
+
+    def test_cluster_errors(self):
+        """Check a failing server is reported without failing the call"""
+        cluster = TautulliCluster({
+            'a': self.client(retry=False),
+            'b': self.client(retry=False)})
+        self.addCleanup(cluster.close)
+        self.mock.fail.append(503)
+        req = cluster.get_activity()
+        self.assertEqual(req['response']['result'], 'success')
+        self.assertEqual(len(req['response']['errors']), 1)
+        sessions = req['response']['data']['sessions']
+        self.assertEqual(len(sessions), 2)
+        self.assertEqual(req['response']['data']['stream_count'], '2')
+
+
+@unittest.skipUnless(optional('aiohttp'), 'requires aiohttp')
+class TestAsyncTautulli(MockTestCase):
+    """Test AsyncTautulli() against the local stand-in server"""
+
+    def run_client(self, fn, **kwargs):
+        """Return await fn(client) of an AsyncTautulli() of the server"""
+        async def main():
+            async with AsyncTautulli(host='127.0.0.1', port=self.mock.port,
+                                     apikey='test', **kwargs) as tautulli:
+                return await fn(tautulli)
+        return asyncio.run(main())
+
+    def test_get_activity(self):
+        """Check an awaited command returns the decoded response"""
+        req = self.run_client(lambda tautulli: tautulli.get_activity())
+        self.assertEqual(req['response']['data']['stream_count'], '2')
+
+    def test_iter_history(self):
+        """Check iter_history() and fetch_all() yield every row in order"""
+        async def rows(tautulli):
+            return ([row['id'] async for row in
+                     tautulli.iter_history(page_size=40)],
+                    await tautulli.fetch_all('get_history', workers=4,
+                                             page_size=30))
+        iterated, fetched = self.run_client(rows)
+        expected = [row['id'] for row in self.mock.rows]
+        self.assertEqual(iterated, expected)
+        self.assertEqual([row['id'] for row in fetched], expected)
+
+    def test_batch(self):
+        """Check batch() keeps the order and returns failures"""
+        commands = [('get_metadata', {'rating_key': key})
+                    for key in range(5)]
+        commands.insert(2, ('get_metadata', {'bogus': 1}))
+        results = self.run_client(lambda tautulli: tautulli.batch(commands))
+        self.assertEqual([r.params for r in results],
+                         [params for _, params in commands])
+        self.assertIsInstance(results[2].error, TypeError)
+        self.assertEqual(
+            [r.result['response']['data']['rating_key']
+             for r in results if r.error is None],
+            ['0', '1', '2', '3', '4'])
+        with self.assertRaises(ValueError):
+            self.run_client(lambda tautulli: tautulli.batch([('close', {})]))
+
+    def test_download(self):
+        """Check download_* returns the same bytes as Tautulli()"""
+        content = self.run_client(lambda tautulli: tautulli.download_log())
+        self.assertEqual(content, self.client().download_log())
+
+    def test_coalesce(self):
+        """Check concurrent identical reads share one request"""
+        self.mock.delay = 0.2
+
+        async def gather(tautulli):
+            return await asyncio.gather(
+                *(tautulli.get_activity() for _ in range(5)))
+        responses = self.run_client(gather, coalesce=True)
+        self.assertEqual(self.mock.requests['get_activity'], 1)
+        self.assertTrue(all(r is responses[0] for r in responses))
+
+    def test_max_concurrency(self):
+        """Check max_concurrency bounds the requests in flight"""
+        self.mock.delay = 0.1
+
+        async def gather(tautulli):
+            start = time.perf_counter()
+            await asyncio.gather(
+                *(tautulli.get_metadata(rating_key=key) for key in range(4)))
+            return time.perf_counter() - start
+        # Two rounds of two requests
+        self.assertGreaterEqual(self.run_client(gather, max_concurrency=2),
+                                0.2)
+        self.assertEqual(self.mock.requests['get_metadata'], 4)
+
+
+class TestHistorySync(MockTestCase):
+    """Test the local history mirror"""
+
+    def mirror(self, **kwargs):
+        """Return a HistorySync() of the stand-in server in memory"""
+        mirror = HistorySync(self.client(), ':memory:', **kwargs)
+        self.addCleanup(mirror.close)
+        return mirror
+
+    def test_sync(self):
+        """Check full, no-op and incremental syncs"""
+        mirror = self.mirror(page_size=50, overlap=3000)
+        self.assertEqual(mirror.sync(), 250)
+        self.assertEqual(mirror.high_water_mark(),
+                         (250, self.mock.rows[0]['started']))
+        self.mock.reset()
+        self.assertEqual(mirror.sync(), 0)
+        # Stopped within the first pages, rows past the overlap are old
+        self.assertLessEqual(self.mock.requests['get_history'], 2)
+        self.addCleanup(setattr, self.mock, 'rows', self.mock.rows)
+        self.mock.rows = history_rows(255)[:5] + self.mock.rows
+        self.assertEqual(mirror.sync(), 5)
+        self.assertEqual(mirror.high_water_mark()[0], 255)
+        self.assertEqual(len(mirror.rows()), 255)
+        self.assertEqual(
+            mirror.query('SELECT COUNT(*) FROM history')[0][0], 255)
+
+    def test_sync_filters(self):
+        """Check every filter set keeps its own high-water mark"""
+        mirror = self.mirror(page_size=100, overlap=0)
+        self.assertEqual(mirror.sync(user_id=1), 250)
+        self.assertEqual(mirror.high_water_mark(), (0, 0))
+        self.assertEqual(mirror.high_water_mark(user_id=1)[0], 250)
+        # Not stopped by the user_id=1 mark, mirrored rows are upserted
+        self.assertEqual(mirror.sync(), 250)
+        self.assertEqual(len(mirror.rows()), 250)
+        self.assertEqual(mirror.sync(user_id=1), 0)
+
+
+class TestDownload(MockTestCase):
+    """Test streamed downloads"""
+
+    def setUp(self):
+        super().setUp()
+        self.path = os.path.join(tempfile.mkdtemp(), 'tautulli.log')
+        self.addCleanup(shutil.rmtree, os.path.dirname(self.path))
+
+    def test_download(self):
+        """Check a download reports its progress and size"""
+        progress = []
+        size = self.client().download_log(
+            dest=self.path, chunk_size=4096,
+            progress=lambda written, total: progress.append(
+                (written, total)))
+        self.assertEqual(size, len(self.mock.file))
+        with open(self.path, 'rb') as f:
+            self.assertEqual(f.read(), self.mock.file)
+        self.assertEqual(progress[-1], (size, size))
+        self.assertEqual(len(progress), size // 4096)
+
+    def test_download_resume(self):
+        """Check a partial file is continued with a Range request"""
+        with open(self.path, 'wb') as f:
+            f.write(self.mock.file[:1000])
+        progress = []
+        size = self.client().download_log(
+            dest=self.path, resume=True,
+            progress=lambda written, total: progress.append(
+                (written, total)))
+        self.assertEqual(size, len(self.mock.file))
+        with open(self.path, 'rb') as f:
+            self.assertEqual(f.read(), self.mock.file)
+        self.assertEqual(progress[-1], (size, size))
+        # Complete: 416, nothing is downloaded again
+        self.assertEqual(self.client().download_log(
+            dest=self.path, resume=True), size)
+
+    def test_download_range_ignored(self):
+        """Check the download starts over if Range is ignored"""
+        self.mock.ranges = False
+        with open(self.path, 'wb') as f:
+            f.write(b'x' * 1000)
+        size = self.client().download_log(dest=self.path, resume=True)
+        self.assertEqual(size, len(self.mock.file))
+        with open(self.path, 'rb') as f:
+            self.assertEqual(f.read(), self.mock.file)
+
+    def test_download_resume_file_object(self):
+        """Check resume is rejected for file objects"""
+        with self.assertRaises(ValueError):
+            self.client().download_log(dest=io.BytesIO(), resume=True)
+        self.assertEqual(self.mock.requests['download_log'], 0)
+
+
+class Response:
+    """Stand-in requests response"""
+
+    def __init__(self, status_code, content=b'', content_type=None):
+        self.status_code = status_code
+        self.content = content
+        self.headers = {'Content-Type': content_type} if content_type else {}
+
+
+class TestImageCache(MockTestCase):
+    """Test the pms_image_proxy disk cache"""
+
+    def setUp(self):
+        super().setUp()
+        self.directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.directory)
+
+    def test_image_cache(self):
+        """Check images are served from disk until max_age passes"""
+        tautulli = self.client(image_cache=ImageCache(self.directory))
+        content = tautulli.pms_image_proxy(rating_key=1)
+        self.assertEqual(content, self.mock.image)
+        self.assertEqual(tautulli.pms_image_proxy(rating_key=1), content)
+        self.assertEqual(self.mock.requests['pms_image_proxy'], 1)
+        self.assertEqual(tautulli.image_cache.size, len(content))
+
+    def test_image_revalidate(self):
+        """Check expired images are revalidated, 304 reads the disk"""
+        tautulli = self.client(
+            image_cache=ImageCache(self.directory, max_age=0), metrics=True)
+        content = tautulli.pms_image_proxy(rating_key=1)
+        self.assertEqual(tautulli.pms_image_proxy(rating_key=1), content)
+        self.assertEqual(self.mock.requests['pms_image_proxy'], 2)
+        self.assertEqual(
+            tautulli.metrics.responses[('pms_image_proxy', '304')], 1)
+        self.assertEqual(tautulli.image_cache.size, len(content))
+
+    def test_image_evict(self):
+        """Check the directory is only scanned past max_bytes"""
+        size = len(self.mock.image)
+        cache = ImageCache(self.directory, max_bytes=size * 2)
+        scans = []
+        images = cache._images
+        cache._images = lambda: scans.append(1) or images()
+        tautulli = self.client(image_cache=cache)
+        for key in (1, 2):
+            tautulli.pms_image_proxy(rating_key=key)
+        self.assertEqual(scans, [])
+        tautulli.pms_image_proxy(rating_key=3)
+        self.assertEqual(scans, [1])
+        self.assertEqual(cache.size, size * 2)
+        self.assertEqual(len(images()), 2)
+        # A new ImageCache counts the existing images once
+        self.assertEqual(ImageCache(self.directory).size, size * 2)
+
+    def test_image_not_cached(self):
+        """Check non-image responses are returned but not cached"""
+        cache = ImageCache(self.directory)
+        body = b'{"response": {"result": "error"}}'
+        requester = Mock()
+        requester.raw.return_value = Response(200, body, 'application/json')
+        self.assertEqual(cache.fetch({'rating_key': 1}, requester), body)
+        self.assertEqual(os.listdir(self.directory), [])
+        self.assertEqual(cache.size, 0)
+
+    def test_image_unexpected_304(self):
+        """Check a 304 to an unconditional request raises"""
+        requester = Mock()
+        requester.raw.return_value = Response(304)
+        with self.assertRaises(TautulliError):
+            ImageCache(self.directory).fetch({'rating_key': 1}, requester)
+
+
+def history_row(year, month, day, user, media_type='movie', duration=60):
+    """Return a get_history row started at noon of a local date"""
+    return {'started': int(datetime(year, month, day, 12).timestamp()),
+            'friendly_name': user, 'media_type': media_type,
+            'duration': duration}
+
+
+class TestHistoryAggregator(unittest.TestCase):
+    """Test local history aggregation, with and without NumPy"""
+
+    rows = [history_row(2024, 1, 7, 'a'),
+            history_row(2024, 1, 7, 'b', 'episode', 30),
+            history_row(2024, 1, 8, 'a', 'episode', 30),
+            history_row(2024, 2, 5, 'a'),
+            history_row(2024, 3, 2, 'c', 'track', 5)]
+
+    def check(self, test):
+        """Run `test` on the NumPy (if installed) and fallback paths"""
+        if optional('numpy') is not None:
+            with self.subTest(numpy=True):
+                test(HistoryAggregator(self.rows))
+        with self.subTest(numpy=False), \
+                patch('aggregate.optional', return_value=None):
+            test(HistoryAggregator(self.rows))
+
+    def test_plays_by_dayofweek(self):
+        """Check plays and durations per weekday"""
+        def test(aggregator):
+            graph = aggregator.plays_by_dayofweek()
+            self.assertEqual(graph['categories'], list(DAYS))
+            series = {s['name']: s['data'] for s in graph['series']}
+            # 2024-01-07 was a Sunday, 01-08 and 02-05 Mondays
+            self.assertEqual(series['Movies'], [1, 1, 0, 0, 0, 0, 0])
+            self.assertEqual(series['TV'], [1, 1, 0, 0, 0, 0, 0])
+            self.assertEqual(series['Music'], [0, 0, 0, 0, 0, 0, 1])
+            graph = aggregator.plays_by_dayofweek(y_axis='duration')
+            series = {s['name']: s['data'] for s in graph['series']}
+            self.assertEqual(series['Movies'], [60, 60, 0, 0, 0, 0, 0])
+        self.check(test)
+
+    def test_plays_per_month(self):
+        """Check plays per month in calendar order"""
+        def test(aggregator):
+            graph = aggregator.plays_per_month()
+            self.assertEqual(graph['categories'],
+                             ['Jan 2024', 'Feb 2024', 'Mar 2024'])
+            self.assertEqual(graph['series'], [
+                {'name': 'Movies', 'data': [1, 1, 0]},
+                {'name': 'Music', 'data': [0, 0, 1]},
+                {'name': 'TV', 'data': [2, 0, 0]}])
+        self.check(test)
+
+    def test_top_users(self):
+        """Check users ranked by plays, with their total duration"""
+        def test(aggregator):
+            self.assertEqual(aggregator.top_users(count=2), [
+                {'friendly_name': 'a', 'total_plays': 3,
+                 'total_duration': 150},
+                {'friendly_name': 'b', 'total_plays': 1,
+                 'total_duration': 30}])
+        self.check(test)
+
+
+class TestValidation(MockTestCase):
+    """Test client-side payload validation"""
+
+    def test_validate(self):
+        """Check valid payloads are sent and invalid ones are not"""
+        tautulli = self.client(validate=True)
+        req = tautulli.get_metadata(rating_key='4348')
+        self.assertEqual(req['response']['result'], 'success')
+        with self.assertRaises(PayloadValidationError):
+            tautulli.get_metadata(rating_key='not a key')
+        with self.assertRaises(PayloadValidationError):
+            tautulli.get_metadata(rating_key=-1)
+        self.assertEqual(self.mock.requests['get_metadata'], 1)
+
+    def test_validate_strict(self):
+        """Check strict mode rejects unknown parameters and commands"""
+        registry = SchemaRegistry()
+        payload = {'apikey': 'test', 'cmd': 'get_metadata', 'rating_key': 1}
+        self.assertTrue(registry.check(payload, strict=True))
+        self.assertTrue(registry.check(dict(payload, bogus=1)))
+        with self.assertRaises(PayloadValidationError):
+            registry.check(dict(payload, bogus=1), strict=True)
+        # arnold has no schema of its own
+        tautulli = self.client(validate='strict')
+        with self.assertRaises(PayloadValidationError):
+            tautulli.arnold()
+        self.client(validate=True).arnold()
+        self.assertEqual(self.mock.requests['arnold'], 1)
+
+    def test_validate_memoized(self):
+        """Check an accepted payload skips schema evaluation next time"""
+        registry = SchemaRegistry()
+        registry.validator = Mock(wraps=registry.validator)
+        payload = {'apikey': 'test', 'cmd': 'get_metadata', 'rating_key': 1}
+        registry.check(payload)
+        registry.check(dict(payload))
+        self.assertEqual(registry.validator.call_count, 1)
+        registry.check(dict(payload, rating_key=2))
+        self.assertEqual(registry.validator.call_count, 2)
+
+
+class TestProjection(MockTestCase):
+    """Test fields= projection with each decoder strategy"""
+
+    def decoders(self):
+        """Yield (name, decoder) of the stdlib hook and the orjson path"""
+        yield 'json', json.loads
+        orjson = optional('orjson')
+        if orjson is not None:
+            yield 'orjson', orjson.loads
+
+    def test_fields(self):
+        """Check rows keep only the requested fields"""
+        for name, decoder in self.decoders():
+            with self.subTest(decoder=name):
+                tautulli = self.client(decoder=decoder)
+                req = tautulli.get_history(length=10,
+                                           fields=['id', 'date'])
+                data = req['response']['data']
+                self.assertEqual(data['recordsTotal'], 250)
+                self.assertEqual([row['id'] for row in data['data']],
+                                 list(range(250, 240, -1)))
+                self.assertEqual({key for row in data['data']
+                                  for key in row}, {'id', 'date'})
+
+    def test_fields_error(self):
+        """Check error envelopes are decoded untouched"""
+        r = {'response': {'result': 'error', 'message': 'Invalid apikey',
+                          'data': {}}}
+        body = json.dumps(r).encode('utf-8')
+        for name, decoder in self.decoders():
+            with self.subTest(decoder=name):
+                self.assertEqual(
+                    projecting_decoder(['id'], decoder)(body), r)
+
+    def test_cluster_fields(self):
+        """Check the cluster drops the order column it added"""
+        cluster = TautulliCluster({'a': self.client(), 'b': self.client()})
+        self.addCleanup(cluster.close)
+        req = cluster.get_history(length=4, fields=['id'])
+        rows = req['response']['data']['data']
+        self.assertEqual([row['id'] for row in rows], [250, 250, 249, 249])
+        self.assertEqual({key for row in rows for key in row},
+                         {'id', 'server'})
+
+
+class TestBatch(MockTestCase):
+    """Test batch() command execution"""
+
+    def test_batch(self):
+        """Check batch() keeps the order and returns failures"""
+        tautulli = self.client(retry=False)
+        commands = [('get_metadata', {'rating_key': key})
+                    for key in range(6)]
+        commands.insert(3, ('get_metadata', {'bogus': 1}))
+        commands.append(('download_log', None))
+        results = tautulli.batch(commands, workers=4)
+        self.assertEqual([(r.cmd, r.params) for r in results],
+                         [(cmd, params or {}) for cmd, params in commands])
+        self.assertIsInstance(results[3].error, TypeError)
+        self.assertIsNone(results[3].result)
+        self.assertEqual(
+            [r.result['response']['data']['rating_key']
+             for r in results[:-1] if r.error is None],
+            ['0', '1', '2', '3', '4', '5'])
+        self.assertEqual(results[-1].result, self.mock.file)
+
+    def test_batch_http_error(self):
+        """Check a failed request does not abort the batch"""
+        tautulli = self.client(retry=False)
+        self.mock.fail.append(503)
+        results = tautulli.batch([('get_activity', {})] * 3, workers=1)
+        self.assertIsInstance(results[0].error, requests.HTTPError)
+        self.assertEqual([r.error for r in results[1:]], [None, None])
+
+    def test_batch_unknown(self):
+        """Check names outside the API commands raise ValueError"""
+        tautulli = self.client()
+        for cmd in ('close', 'batch', '_cmd', 'nope'):
+            with self.subTest(cmd=cmd), self.assertRaises(ValueError):
+                tautulli.batch([('get_activity', {}), (cmd, {})])
+        self.assertEqual(self.mock.requests['get_activity'], 0)
+
+
+class TestRecords(MockTestCase):
+    """Test the compact record classes"""
+
+    def test_record_fields(self):
+        """Check slot and rare fields read alike and round-trip"""
+        row = history_rows(1)[0]
+        record = HistoryRow.from_dict(row)
+        self.assertEqual(record.user, 'DanyKhaleesi69')
+        self.assertEqual(record.thumb, row['thumb'])
+        self.assertEqual(record['year'], 2016)
+        self.assertIsNone(record.get('bogus'))
+        self.assertIn('group_ids', record)
+        self.assertNotIn('bogus', record)
+        with self.assertRaises(AttributeError):
+            record.bogus
+        with self.assertRaises(KeyError):
+            record['bogus']
+        self.assertEqual(record.to_dict(), row)
+        self.assertEqual(set(record.keys()), set(row))
+        self.assertFalse(hasattr(record, '__dict__'))
+        copy = pickle.loads(pickle.dumps(record))
+        self.assertIsInstance(copy, HistoryRow)
+        self.assertEqual(copy, record)
+        self.assertEqual(copy.to_dict(), row)
+
+    def test_record_shapes(self):
+        """Check one builder is compiled per row shape"""
+        rows = history_rows(3)
+        del rows[2]['thumb'], rows[2]['user']
+        records = HistoryRow.from_rows(rows)
+        self.assertIs(records[0]._shape, records[1]._shape)
+        self.assertIsNot(records[0]._shape, records[2]._shape)
+        self.assertNotIn('user', records[2])
+        with self.assertRaises(AttributeError):
+            records[2].user
+        self.assertEqual([r.to_dict() for r in records], rows)
+
+    def test_record_sharing(self):
+        """Check equal strings of decoded rows are stored once"""
+        tautulli = self.client()
+        rows = tautulli.get_history(length=20, as_records=True)
+        rows = rows['response']['data']['data']
+        self.assertIsInstance(rows[0], HistoryRow)
+        self.assertIs(rows[0].title, rows[1].title)
+        self.assertIs(rows[0].thumb, rows[1].thumb)
+        plain = tautulli.get_history(length=20)['response']['data']['data']
+        self.assertIsNot(plain[0]['title'], plain[1]['title'])
+
+    def test_records_unsupported(self):
+        """Check as_records=True is refused for commands without records"""
+        tautulli = self.client()
+        with self.assertRaisesRegex(ValueError, 'get_users_table'):
+            list(tautulli.paginate('get_users_table', as_records=True))
+        cluster = TautulliCluster({'a': tautulli})
+        self.addCleanup(cluster.close)
+        with self.assertRaisesRegex(ValueError, 'get_users_table'):
+            cluster.run('get_users_table', as_records=True)
+
+
+class TestMetrics(MockTestCase):
+    """Test the request metrics registry"""
+
+    def test_prometheus(self):
+        """Check the exposition of retries, statuses and histograms"""
+        tautulli = self.client(metrics=True, retry=RetryPolicy(backoff=0))
+        self.mock.fail.append(503)
+        tautulli.get_activity()
+        failing = self.client(metrics=tautulli.metrics, retry=False)
+        self.mock.fail.append(503)
+        with self.assertRaises(requests.HTTPError):
+            failing.get_activity()
+        tautulli.metrics.record('get_"a\\b\n"', 200, {'total': 20})
+        text = tautulli.metrics.to_prometheus()
+        self.assertTrue(text.endswith('\n'))
+        lines = text.splitlines()
+        self.assertIn('# TYPE tautulli_request_seconds histogram', lines)
+        self.assertIn('tautulli_responses_total{cmd="get_activity",'
+                      'status="200"} 1', lines)
+        self.assertIn('tautulli_responses_total{cmd="get_activity",'
+                      'status="503"} 1', lines)
+        self.assertIn('tautulli_retries_total{cmd="get_activity"} 1', lines)
+        self.assertIn('tautulli_request_seconds_count{cmd="get_\\"a\\\\b'
+                      '\\n\\"",phase="total"} 1', lines)
+        # Bucket counts never decrease and end with +Inf at the count
+        prefix = 'tautulli_response_bytes_bucket{cmd="get_activity",le="'
+        buckets = [line[len(prefix):].split('"} ') for line in lines
+                   if line.startswith(prefix)]
+        self.assertEqual(len(buckets), 7)
+        self.assertEqual(buckets[-1], ['+Inf', '2'])
+        counts = [int(count) for _, count in buckets]
+        self.assertEqual(counts, sorted(counts))
+        self.assertIn('tautulli_response_bytes_count{cmd="get_activity"} 2',
+                      lines)
+        prefix = ('tautulli_request_seconds_bucket{cmd="get_\\"a\\\\b'
+                  '\\n\\"",phase="total",le="')
+        self.assertEqual(
+            [line[len(prefix):] for line in lines
+             if line.startswith(prefix)][-3:],
+            ['5"} 0', '10"} 0', '+Inf"} 1'])
+
+
+class TestColumnar(MockTestCase):
+    """Test the column-oriented result conversion"""
+
+    rows = [{'id': 1, 'duration': 1.5, 'user': 'a', 'flag': True},
+            {'id': 2, 'duration': 2, 'user': 'b', 'flag': False,
+             'year': 2016},
+            {'id': 3, 'user': 'a', 'flag': True}]
+
+    def test_rows_to_columns_numpy(self):
+        """Check numeric columns become int64/float64 NumPy arrays"""
+        numpy = optional('numpy')
+        if numpy is None:
+            self.skipTest('requires numpy')
+        rows = self.rows[:2]
+        columns = rows_to_columns(rows)
+        self.assertEqual(columns['id'].dtype, numpy.int64)
+        self.assertEqual(columns['id'].tolist(), [1, 2])
+        self.assertEqual(columns['duration'].dtype, numpy.float64)
+        self.assertEqual(columns['duration'].tolist(), [1.5, 2.0])
+
+    def test_rows_to_columns_array(self):
+        """Check numeric columns become array.array without NumPy"""
+        with patch('columnar.optional', return_value=None):
+            columns = rows_to_columns(self.rows[:2])
+        self.assertIsInstance(columns['id'], array)
+        self.assertEqual(columns['id'].typecode, 'q')
+        self.assertEqual(columns['id'].tolist(), [1, 2])
+        self.assertEqual(columns['duration'].typecode, 'd')
+        self.assertEqual(columns['duration'].tolist(), [1.5, 2.0])
+
+    def test_rows_to_columns_lists(self):
+        """Check missing keys pad with None and other columns stay lists"""
+        columns = rows_to_columns(self.rows)
+        self.assertEqual(list(columns), ['id', 'duration', 'user', 'flag',
+                                         'year'])
+        self.assertEqual(len(columns['id']), 3)
+        self.assertEqual(columns['duration'], [1.5, 2, None])
+        self.assertEqual(columns['year'], [None, 2016, None])
+        self.assertEqual(columns['user'], ['a', 'b', 'a'])
+        self.assertEqual(columns['flag'], [True, False, True])
+        self.assertEqual(rows_to_columns([]), {})
+
+    def test_as_columns(self):
+        """Check as_columns=True converts table rows of a response"""
+        tautulli = self.client()
+        r = tautulli.get_history(length=10, as_columns=True)
+        data = r['response']['data']
+        self.assertEqual(data['recordsFiltered'], 250)
+        self.assertEqual(len(data['data']['id']), 10)
+        self.assertEqual(list(data['data']['user']), ['DanyKhaleesi69'] * 10)
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -1,57 +1,122 @@
 """
-Validator Class
+SchemaRegistry class
 """
 import os
 import json
-from jsonschema import validate, ValidationError, SchemaError, RefResolver
-
-
-class Validator:
-    """JSON Schema validator class"""
-
-    def __init__(self, payload):
-        """Validator constructor"""
-        self.payload = payload
-        self.name = self._get_cmd()
-        self.schema_file = self._get_schema_file_name()
-        # self.base_pl_keys = ['apikey', 'cmd', 'out_type', 'callback', 'debug']
-        self._schema_dir = os.path.abspath('schemas')
-        # Ref resolver for schema files
-        self._resolver = RefResolver(
-            'file:///{}/'.format(self._schema_dir), None)
-
-    def _get_schema_file_name(self):
-        """Return schema file name"""
-        if self.payload.keys() in (
-            'apikey', 'cmd', 'out_type', 'callback', 'debug'
-        ):
-            return './schemas/payload.json'
-        else:
-            return './schemas/{}.json'.format(self.name)
-
-    def _get_cmd(self):
-        return self.payload['cmd']
-
-    def validate(self):
-        """Validate payload with JSON Schema"""
+import threading
+from functools import lru_cache
+from exceptions import PayloadValidationError
+from lazy import optional
+
+
+SCHEMA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                          'schemas')
+
+
+class SchemaRegistry:
+    """Compiled JSON Schema validator registry"""
+
+    def __init__(self, schema_dir=SCHEMA_DIR):
+        """SchemaRegistry constructor"""
+        self.schema_dir = schema_dir
+        # Schema file name (without .json) -> schema dict, None if missing
+        self._schemas = {}
+        # Command -> compiled validator
+        self._validators = {}
+        self._lock = threading.Lock()
+        # Recently accepted payloads skip schema evaluation
+        self._checked = lru_cache(maxsize=1024)(self._check)
+
+    def schema(self, name):
+        """Return a schema by file name, reading it from disk once"""
+        try:
+            return self._schemas[name]
+        except KeyError:
+            pass
+        try:
+            with open(os.path.join(self.schema_dir,
+                                   '{}.json'.format(name)), 'r') as f:
+                schema = json.load(f)
+        except FileNotFoundError:
+            schema = None
+        self._schemas[name] = schema
+        return schema
+
+    def load_all(self):
+        """Read and compile every schema file up front"""
+        for file_name in sorted(os.listdir(self.schema_dir)):
+            name, ext = os.path.splitext(file_name)
+            if ext == '.json' and name not in ('payload', 'schema'):
+                self.validator(name)
+
+    def validator(self, cmd):
+        """Return the compiled validator of an API command"""
         try:
-            with open(self.schema_file, 'r') as schema_file:
-                schema = json.load(schema_file)
-                validate(instance=self.payload, schema=schema,
-                         resolver=self._resolver)
-        except OSError as e:
-            if e.errno == 2:
-                with open('./schemas/payload.json', 'r') as schema_file:
-                    schema = json.load(schema_file)
-                    validate(instance=self.payload, schema=schema,
-                             resolver=self._resolver)
-            else:
-                pass
-        except ValidationError as e:
-            print(':::VALIDATION ERROR:::\n{0}'.format(
-                e.message))
-            print(e)
-        except SchemaError as e:
-            print(':::SCHEMA ERROR:::\n{0}'.format(
-                e.message))
-            print(e)
+            return self._validators[cmd]
+        except KeyError:
+            pass
+        with self._lock:
+            if cmd not in self._validators:
+                schema = self.schema(cmd) or self.schema('payload')
+                self._validators[cmd] = self._compile(schema)
+        return self._validators[cmd]
+
+    def check(self, payload, strict=False):
+        """
+        Validate a payload, raising PayloadValidationError if invalid.
+
+        In strict mode the command must have its own schema and every
+        parameter must be declared in it.
+        """
+        try:
+            key = tuple(sorted(payload.items()))
+        except TypeError:
+            # Unhashable values, validate without memoizing
+            return self._check(tuple(payload.items()), strict)
+        return self._checked(key, strict)
+
+    def _check(self, items, strict):
+        payload = dict(items)
+        cmd = payload.get('cmd')
+        if strict:
+            schema = self.schema(cmd)
+            if schema is None:
+                raise PayloadValidationError(cmd, 'no schema for command')
+            known = set(schema.get('properties', ()))
+            known.update(self.schema('payload')['properties'])
+            unknown = sorted(set(payload) - known)
+            if unknown:
+                raise PayloadValidationError(cmd, 'unknown parameter(s) {}'
+                                             .format(', '.join(unknown)))
+        error = next(self.validator(cmd).iter_errors(payload), None)
+        if error is not None:
+            raise PayloadValidationError(cmd, error.message)
+        return True
+
+    def _compile(self, schema):
+        """Check a schema and build its validator, $refs resolve in memory"""
+        # jsonschema is only needed once validation is enabled
+        from jsonschema import Draft7Validator
+        Draft7Validator.check_schema(schema)
+        referencing = optional('referencing')
+        if referencing is not None:
+            registry = referencing.Registry(retrieve=self._retrieve)
+            return Draft7Validator(schema, registry=registry)
+        from jsonschema import RefResolver
+        resolver = RefResolver.from_schema(schema, store={
+            name.rstrip('#'): s for name, s in self._schemas.items() if s})
+        return Draft7Validator(schema, resolver=resolver)
+
+    def _retrieve(self, uri):
+        """Resolve a $ref URI ("get_history#", "payload") to a resource"""
+        schema = self.schema(uri.split('/')[-1].rstrip('#'))
+        if schema is None:
+            from referencing.exceptions import NoSuchResource
+            raise NoSuchResource(ref=uri)
+        from referencing import Resource
+        return Resource.from_contents(schema)
+
+
+# Registry shared by every Tautulli client
+registry = SchemaRegistry()
+